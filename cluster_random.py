@@ -391,12 +391,7 @@ class ClusterRandomSampling:
     # Triggered when the sampling area combo box index changes
     def on_comboBoxshpsampling_currentIndexChanged(self, index):
         if index >= 0:
-            layer_name = self.ui.comboBoxshpsampling.currentText()
-            layer = None
-            for lyr in QgsProject.instance().mapLayers().values():
-                if lyr.name() == layer_name:
-                    layer = lyr
-                    break
+            layer = self.ui._resolve_sampling_layer()
 
             if layer and isinstance(layer, QgsVectorLayer):
                 self.sampling_area = layer
@@ -728,9 +723,10 @@ class ClusterRandomSampling:
         nearest_feature = None
         min_distance = float('inf')
 
+        query_geom = QgsGeometry.fromPointXY(point)
         # Find the nearest feature
         for feature in self.temp_layer.getFeatures():
-            distance = feature.geometry().distance(QgsGeometry.fromPointXY(point))
+            distance = feature.geometry().distance(query_geom)
             if distance < min_distance:
                 min_distance = distance
                 nearest_feature = feature
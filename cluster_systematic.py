@@ -222,12 +222,7 @@ class ClusterSystematicSampling:
     def on_comboBoxshpsampling_currentIndexChanged(self, index):
         # Updates the currently selected sampling area layer
         if index >= 0:
-            layer_name = self.dialog.comboBoxshpsampling.currentText().split(" [")[0]
-            layer = None
-            for lyr in QgsProject.instance().mapLayers().values():
-                if lyr.name() == layer_name:
-                    layer = lyr
-                    break
+            layer = self.dialog._resolve_sampling_layer()
 
             if layer and isinstance(layer, QgsVectorLayer):
                 self.sampling_area = layer
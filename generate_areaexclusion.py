@@ -85,8 +85,8 @@ class AreaExclusionModule:
         """
         Connects UI elements (checkboxes, buttons, etc.) to their respective methods.
         """
-        self.dialog.checkBoxshpsamplingarea.stateChanged.connect(self.toggle_buttons)
-        self.dialog.checkBoxgenerateshpbycoordinates.stateChanged.connect(self.toggle_buttons)
+        # The two checkboxes reach toggle_buttons through the dialog's handlers,
+        # which also make the dialog the receiver that toggle_buttons reads the sender from
         self.dialog.pushButtonareasampleshp.clicked.connect(self.start_area_digitizing)
         self.dialog.pushButtoncirclesampleshp.clicked.connect(self.start_circle_digitizing)
         self.dialog.pushButtonfinishareashp.clicked.connect(self.save_final_shapefile)
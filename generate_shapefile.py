@@ -480,10 +480,9 @@ class Stratifiedshapefile(QObject):
 
     def load_sampling_area(self):
         # Loads the sampling area selected in comboBoxshpsampling.
-        layer_name = self.dialog.comboBoxshpsampling.currentText().split(" [")[0]
-        layers = QgsProject.instance().mapLayersByName(layer_name)
-        if layers:
-            self.sampling_area = layers[0]
+        layer = self.dialog._resolve_sampling_layer()
+        if layer:
+            self.sampling_area = layer
             print(f"Sampling area loaded: {self.sampling_area.name()}")
         else:
             QMessageBox.warning(None, "Error", "Sampling area not found.")
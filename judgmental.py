@@ -37,19 +37,27 @@
 
 # Importing Python libraries for file handling, CSV, data manipulation, and QGIS components
 import os
+import re
 import csv
+import bisect
+import numpy as np
 import pandas as pd
 from qgis.PyQt.QtWidgets import (
    QMessageBox, QFileDialog, QInputDialog, QAction
 )
 from qgis.core import (
-   QgsProject, QgsVectorLayer, QgsFeature, QgsGeometry,
-   QgsPointXY, QgsField, QgsSymbol, QgsSingleSymbolRenderer,
+   QgsProject, QgsVectorLayer, QgsGeometry,
+   QgsPoint, QgsPointXY, QgsField, QgsSymbol, QgsSingleSymbolRenderer,
    QgsVectorFileWriter, QgsSvgMarkerSymbolLayer,
-   QgsFeatureRequest
+   QgsFeatureRequest, QgsVectorLayerUtils, QgsExpressionContext,
+   QgsRectangle
 )
 from qgis.gui import QgsMapTool
 from qgis.PyQt.QtCore import Qt, QVariant
+from qgis.PyQt import sip
+
+# Matches the leading "N)" order prefix of the coordinate list entries
+_ORDER_RE = re.compile(r'^(\d+)\)')
 
 
 class JudgmentalSampling:
@@ -63,7 +71,11 @@ class JudgmentalSampling:
         self.map_tool = None
         self.sampling_area = None
         self.exclusion_zones = []
-        self.sample_order = []
+        self._order_to_fid = {}
+        # Coordinates and order of the current samples kept as parallel arrays
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._orders = np.empty(0, dtype=np.int64)
         self.coordinates_list = []
         self.sampling_method = None
         self.allow_outside_sampling = False
@@ -96,6 +108,14 @@ class JudgmentalSampling:
             self.finish_sampling_by_file)
 
         QgsProject.instance().layerRemoved.connect(self.handle_layer_removed)
+        self.canvas.scaleChanged.connect(self.update_click_tolerance)
+        # A new destination CRS changes the map units without necessarily changing the scale
+        self.canvas.destinationCrsChanged.connect(self.update_click_tolerance)
+        self.update_click_tolerance()
+
+    def update_click_tolerance(self, *args):
+        # Caches the right-click removal tolerance (10 pixels in map units) for the current scale and CRS
+        self.click_tolerance = self.canvas.mapUnitsPerPixel() * 10
 
     def is_temp_layer_valid(self):
         # Checks if the temporary layer exists and is present in the QGIS project
@@ -229,7 +249,8 @@ class JudgmentalSampling:
                 QgsProject.instance().removeMapLayer(self.temp_layer.id())
             self.temp_layer = None
             self.sample_count = 0
-            self.sample_order.clear()
+            self.clear_sample_store()
+            self.coordinates_list.clear()
             self.dialog.listWidgetlistofcoordinates_judgmental.clear()
             self.file_data = None
             self.selected_x_column = None
@@ -354,13 +375,12 @@ class JudgmentalSampling:
     def initialize_sampling(self):
         # Prepares the sampling process, creating or re-initializing the temporary layer if needed
         print("Initializing sampling...")
-        layer_name = self.dialog.comboBoxshpsampling.currentText().split(" [")[0]
-        layers = QgsProject.instance().mapLayersByName(layer_name)
-        if not layers:
+        layer = self.dialog._resolve_sampling_layer()
+        if not layer:
             QMessageBox.warning(
                 self.dialog, "Error", "No shapefile has been loaded/selected as the sampling area.")
             return False
-        self.sampling_area = layers[0]
+        self.sampling_area = layer
         print(f"Sampling area layer: {self.sampling_area.name()}")
         self.exclusion_zones = []
         for i in range(self.dialog.listWidgetexclusion.count()):
@@ -372,7 +392,7 @@ class JudgmentalSampling:
         if not self.is_temp_layer_valid():
             self.create_temporary_layer()
             self.sample_count = 0
-            self.sample_order.clear()
+            self.clear_sample_store()
             self.coordinates_list.clear()
             print("Temporary layer created")
         if self.sampling_method == 'file':
@@ -387,18 +407,32 @@ class JudgmentalSampling:
             self.dialog.pushButtonedition.setEnabled(False)
         return True
 
-    def update_coordinates_list(self):
-        # Updates the list widget with newly added coordinates in coordinate sampling mode
+    def update_coordinates_list(self, remove_index=None, add_item=None):
+        # Updates the list widget with the coordinates in coordinate sampling mode.
+        # Entries are labelled with their sample order, and self.coordinates_list keeps
+        # those orders in row order so single additions/removals touch one row only
         if self.sampling_method != 'coordinates':
             return
-        self.dialog.listWidgetlistofcoordinates_judgmental.clear()
+        list_widget = self.dialog.listWidgetlistofcoordinates_judgmental
+        if remove_index is not None:
+            row = bisect.bisect_left(self.coordinates_list, remove_index)
+            if row < len(self.coordinates_list) and self.coordinates_list[row] == remove_index:
+                del self.coordinates_list[row]
+                list_widget.takeItem(row)
+            return
+        if add_item is not None:
+            order, x, y = add_item
+            self.coordinates_list.append(order)
+            list_widget.addItem(f"{order}) {x}, {y}")
+            return
+        list_widget.clear()
+        self.coordinates_list.clear()
         features = sorted(self.temp_layer.getFeatures(),
                           key=lambda f: f['Order'])
-        for i, feature in enumerate(features, 1):
+        for feature in features:
             point = feature.geometry().asPoint()
-            self.dialog.listWidgetlistofcoordinates_judgmental.addItem(
-                f"{i}) {point.x()}, {point.y()}"
-            )
+            self.coordinates_list.append(feature['Order'])
+            list_widget.addItem(f"{feature['Order']}) {point.x()}, {point.y()}")
 
     def add_coordinates(self, point=None):
         # Adds a coordinate to the temporary layer, either from user input or map clicks
@@ -439,23 +473,12 @@ class JudgmentalSampling:
                     QMessageBox.warning(
                         self.dialog, "Invalid Location", "The sample point is within an exclusion zone.")
                     return
-                self.sample_count += 1
-                feature = QgsFeature(self.temp_layer.fields())
-                feature.setGeometry(QgsGeometry.fromPointXY(input_point))
-                feature.setAttributes([
-                    self.sample_count,
-                    f"{self.dialog.lineEditsamplelabel.text().strip()}{self.sample_count}",
-                    input_point.x(),
-                    input_point.y(),
-                    self.sample_count
-                ])
-                success = self.temp_layer.dataProvider().addFeatures([feature])
-                if not success:
+                if not self._append_features([(input_point.x(), input_point.y(), input_point)]):
                     print("Failed to add feature to layer")
                     return
-                self.sample_order.append(self.sample_count)
                 if self.sampling_method == 'coordinates':
-                    self.update_coordinates_list()
+                    self.update_coordinates_list(
+                        add_item=(self.sample_count, input_point.x(), input_point.y()))
                 self.temp_layer.triggerRepaint()
                 self.canvas.refresh()
                 if point is None and self.sampling_method == 'coordinates':
@@ -591,38 +614,9 @@ class JudgmentalSampling:
                 reply = "add_all"
             if reply == "cancel":
                 return
-            points_to_add = []
-            if reply == "add_all":
-                for x, y, point in all_points:
-                    self.sample_count += 1
-                    feature = QgsFeature(self.temp_layer.fields())
-                    feature.setGeometry(QgsGeometry.fromPointXY(point))
-                    feature.setAttributes([
-                        self.sample_count,
-                        f"{self.dialog.lineEditsamplelabel.text().strip()}{self.sample_count}",
-                        x,
-                        y,
-                        self.sample_count
-                    ])
-                    points_to_add.append(feature)
-                    self.sample_order.append(self.sample_count)
-            elif reply == "add_valid":
-                for x, y, point in valid_points:
-                    self.sample_count += 1
-                    feature = QgsFeature(self.temp_layer.fields())
-                    feature.setGeometry(QgsGeometry.fromPointXY(point))
-                    feature.setAttributes([
-                        self.sample_count,
-                        f"{self.dialog.lineEditsamplelabel.text().strip()}{self.sample_count}",
-                        x,
-                        y,
-                        self.sample_count
-                    ])
-                    points_to_add.append(feature)
-                    self.sample_order.append(self.sample_count)
+            points_to_add = all_points if reply == "add_all" else valid_points
             if points_to_add:
-                success = self.temp_layer.dataProvider().addFeatures(points_to_add)
-                if not success:
+                if not self._append_features(points_to_add):
                     QMessageBox.warning(
                         self.dialog, "Error", "Failed to add features to the layer.")
                     return
@@ -645,18 +639,80 @@ class JudgmentalSampling:
             QMessageBox.warning(
                 self.dialog, "Error", f"Failed to add coordinates from file: {str(e)}")
 
+    def _append_features(self, items):
+        # Adds one sample feature per (x, y, point) item and records its order
+        success, added_features = self.temp_layer.dataProvider().addFeatures(
+            QgsVectorLayerUtils.createFeatures(
+                self.temp_layer, list(self._gen_feature_data(items)), QgsExpressionContext()))
+        if success:
+            self.register_added_features(added_features)
+        return success
+
+    def _gen_feature_data(self, items):
+        # Yields the geometry and attributes of each new sample, numbering them as it goes
+        fields = self.temp_layer.fields()
+        id_idx = fields.indexOf('ID')
+        samples_idx = fields.indexOf('Samples')
+        x_idx = fields.indexOf('X_coordinates')
+        y_idx = fields.indexOf('Y_coordinates')
+        order_idx = fields.indexOf('Order')
+        label_fmt = self.sample_label_formatter()
+        for x, y, _point in items:
+            self.sample_count += 1
+            sid = self.sample_count
+            yield QgsVectorLayerUtils.QgsFeatureData(
+                QgsGeometry(QgsPoint(x, y)),
+                {id_idx: sid, samples_idx: label_fmt(sid),
+                 x_idx: x, y_idx: y, order_idx: sid}
+            )
+
+    def sample_label_formatter(self):
+        # Returns a callable mapping a sample id to its label, e.g. 7 -> "S7" for the root "S"
+        label_root = self.dialog.lineEditsamplelabel.text().strip()
+        return (label_root.replace('%', '%%') + "%d").__mod__
+
+    def register_added_features(self, features):
+        # Records the feature id and coordinates assigned to each sample order
+        xs, ys, orders = [], [], []
+        for feature in features:
+            self._order_to_fid[feature['Order']] = feature.id()
+            xs.append(feature['X_coordinates'])
+            ys.append(feature['Y_coordinates'])
+            orders.append(feature['Order'])
+        self._xs = np.concatenate((self._xs, np.asarray(xs, dtype=np.float64)))
+        self._ys = np.concatenate((self._ys, np.asarray(ys, dtype=np.float64)))
+        self._orders = np.concatenate((self._orders, np.asarray(orders, dtype=np.int64)))
+
+    def drop_sample(self, index):
+        # Forgets the sample at the given array position in every bookkeeping structure
+        order = int(self._orders[index])
+        self._xs = np.delete(self._xs, index)
+        self._ys = np.delete(self._ys, index)
+        self._orders = np.delete(self._orders, index)
+        return self._order_to_fid.pop(order, None)
+
+    def clear_sample_store(self):
+        # Empties the sample bookkeeping when the temporary layer is recreated or discarded
+        self._order_to_fid.clear()
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._orders = np.empty(0, dtype=np.int64)
+
     def remove_coordinate(self, item):
         # Removes a coordinate from the temporary layer when a list item is double-clicked
         try:
-            text = item.text()
-            index = int(text.split(')')[0])
-            request = QgsFeatureRequest().setFilterExpression(f'"Order" = {index}')
-            feature_ids = [f.id() for f in self.temp_layer.getFeatures(request)]
-            if feature_ids:
-                self.temp_layer.dataProvider().deleteFeatures(feature_ids)
-                if index in self.sample_order:
-                    self.sample_order.remove(index)
-                self.update_coordinates_list()
+            match = _ORDER_RE.match(item.text())
+            if not match:
+                return
+            index = int(match.group(1))
+            positions = np.flatnonzero(self._orders == index)
+            if positions.size == 0:
+                return
+            # Only forget the sample once its feature is actually gone from the layer
+            fid = self._order_to_fid.get(index)
+            if fid is not None and self.temp_layer.dataProvider().deleteFeatures([fid]):
+                self.drop_sample(int(positions[0]))
+                self.update_coordinates_list(remove_index=index)
                 self.temp_layer.triggerRepaint()
                 self.canvas.refresh()
         except Exception as e:
@@ -670,21 +726,21 @@ class JudgmentalSampling:
             return
         if not isinstance(point, QgsPointXY):
             return
-        tolerance = self.canvas.mapUnitsPerPixel() * 10
-        closest_feature = None
-        min_distance = float('inf')
-        for feature in self.temp_layer.getFeatures():
-            feature_point = feature.geometry().asPoint()
-            distance = point.distance(feature_point)
-            if distance < min_distance:
-                min_distance = distance
-                closest_feature = feature
-        if closest_feature and min_distance < tolerance:
-            self.temp_layer.dataProvider().deleteFeatures([closest_feature.id()])
-            if closest_feature['Order'] in self.sample_order:
-                self.sample_order.remove(closest_feature['Order'])
+        if self._xs.size == 0:
+            return
+        tolerance = self.click_tolerance
+        dx = self._xs - point.x()
+        dy = self._ys - point.y()
+        d2 = dx * dx + dy * dy
+        closest = int(d2.argmin())
+        if d2[closest] < tolerance * tolerance:
+            order = int(self._orders[closest])
+            fid = self._order_to_fid.get(order)
+            if fid is None or not self.temp_layer.dataProvider().deleteFeatures([fid]):
+                return
+            self.drop_sample(closest)
             if self.sampling_method == 'coordinates':
-                self.update_coordinates_list()
+                self.update_coordinates_list(remove_index=order)
             self.temp_layer.triggerRepaint()
             self.canvas.refresh()
 
@@ -715,10 +771,15 @@ class JudgmentalSampling:
         self.temp_layer.setRenderer(QgsSingleSymbolRenderer(symbol))
         QgsProject.instance().addMapLayer(self.temp_layer)
 
+    def point_filter_request(self, point):
+        # Builds a request that only fetches features whose bounding box contains the point
+        return QgsFeatureRequest().setFilterRect(
+            QgsRectangle(point.x(), point.y(), point.x(), point.y()))
+
     def is_point_within_sampling_area(self, point):
         # Checks if a given point is inside the sampling area's geometry
         point_geom = QgsGeometry.fromPointXY(point)
-        for feature in self.sampling_area.getFeatures():
+        for feature in self.sampling_area.getFeatures(self.point_filter_request(point)):
             if feature.geometry().contains(point_geom):
                 return True
         return False
@@ -726,35 +787,44 @@ class JudgmentalSampling:
     def is_point_in_exclusion_zones(self, point):
         # Checks if a given point is inside any of the exclusion zone layers
         point_geom = QgsGeometry.fromPointXY(point)
+        request = self.point_filter_request(point)
         for zone in self.exclusion_zones:
-            for feature in zone.getFeatures():
+            for feature in zone.getFeatures(request):
                 if feature.geometry().contains(point_geom):
                     return True
         return False
 
     def renumber_features(self):
         # Renumbers the features so that their order starts at 1 and increments sequentially
-        features = sorted(self.temp_layer.getFeatures(),
-                          key=lambda f: f['Order'])
-        updates = {}
-        label_root = self.dialog.lineEditsamplelabel.text().strip()
-        for new_id, feature in enumerate(features, 1):
-            updates[feature.id()] = {
-                self.temp_layer.fields().indexOf('ID'): new_id,
-                self.temp_layer.fields().indexOf('Samples'): f"{label_root}{new_id}",
-                self.temp_layer.fields().indexOf('Order'): new_id
-            }
+        fields = self.temp_layer.fields()
+        id_idx = fields.indexOf('ID')
+        samples_idx = fields.indexOf('Samples')
+        order_idx = fields.indexOf('Order')
+        label_fmt = self.sample_label_formatter()
+        sort_idx = np.argsort(self._orders, kind='stable')
+        fids = [self._order_to_fid[order] for order in self._orders[sort_idx].tolist()]
+        new_ids = np.arange(1, len(fids) + 1, dtype=np.int64)
+        updates = {
+            fid: {id_idx: new_id, samples_idx: label_fmt(new_id), order_idx: new_id}
+            for fid, new_id in zip(fids, new_ids.tolist())
+        }
+        self._xs = self._xs[sort_idx]
+        self._ys = self._ys[sort_idx]
+        self._orders = new_ids
+        self._order_to_fid = dict(zip(new_ids.tolist(), fids))
         self.temp_layer.dataProvider().changeAttributeValues(updates)
+        # Relabel the list entries with the new orders
+        self.update_coordinates_list()
 
     def handle_layer_removed(self, layer_id):
         # Handles cleanup when a layer is removed from the QGIS project
-        try:
-            if self.temp_layer and self.temp_layer.id() == layer_id:
-                self.temp_layer = None
-                self.dialog.pushButtonedition.setEnabled(True)
-                self.dialog.pushButtonfinishedition.setEnabled(False)
-        except RuntimeError:
+        if self.temp_layer is None or sip.isdeleted(self.temp_layer):
+            self.temp_layer = None
+            return
+        if self.temp_layer.id() == layer_id:
             self.temp_layer = None
+            self.dialog.pushButtonedition.setEnabled(True)
+            self.dialog.pushButtonfinishedition.setEnabled(False)
 
 
 class SamplingMapTool(QgsMapTool):
@@ -766,18 +836,12 @@ class SamplingMapTool(QgsMapTool):
 
     def canvasReleaseEvent(self, event):
         # Detects left or right clicks and adds or removes points accordingly
-        if event.button() == Qt.LeftButton:
-            point = self.toMapCoordinates(event.pos())
-            if isinstance(point, QgsPointXY):
-                self.sampling.add_coordinates(point)
-            else:
-                print(f"Invalid point type from canvas: {type(point)}")
-        elif event.button() == Qt.RightButton:
-            point = self.toMapCoordinates(event.pos())
-            if isinstance(point, QgsPointXY):
-                self.sampling.remove_point_by_coordinates(point)
-            else:
-                print(f"Invalid point type from canvas: {type(point)}")
+        point = self.toMapCoordinates(event.pos())
+        button = event.button()
+        if button == Qt.LeftButton:
+            self.sampling.add_coordinates(point)
+        elif button == Qt.RightButton:
+            self.sampling.remove_point_by_coordinates(point)
 
     def isZoomTool(self):
         # Indicates this map tool is not a zoom tool
@@ -36,11 +36,13 @@
 """
 
 import os
-import random
+import threading
+from contextlib import contextmanager
+import numpy as np
 from qgis.core import (
     QgsGeometry, QgsFeature, QgsPointXY, QgsVectorLayer, QgsField,
     QgsProject, QgsSingleSymbolRenderer, QgsMarkerSymbol, QgsVectorFileWriter,
-    QgsWkbTypes, QgsSvgMarkerSymbolLayer, QgsFeatureRequest
+    QgsWkbTypes, QgsSvgMarkerSymbolLayer, QgsFeatureRequest, QgsPoint
 )
 from qgis.PyQt.QtCore import QVariant, Qt, QCoreApplication, QThread, pyqtSignal
 from qgis.PyQt.QtWidgets import (
@@ -48,6 +50,31 @@ from qgis.PyQt.QtWidgets import (
 )
 from qgis.gui import QgsMapTool
 
+from .sampling_utils import SampleGrid, bounding_boxes, boxes_near_point, points_in_boxes
+
+# Number of random candidates drawn at once by the sampling worker
+CANDIDATE_BATCH_SIZE = 4096
+# Number of surviving candidates processed between two checks of the cancel request
+CANCEL_CHECK_INTERVAL = 64
+# Number of accepted samples between two progress updates sent to the dialog
+PROGRESS_EMIT_INTERVAL = 16
+
+
+class PreparedGeometry:
+    # A geometry with its prepared GEOS engine, so repeated predicates against it stay cheap.
+    # The engine does not own the geometry, which is why both are kept together here
+    def __init__(self, geometry):
+        self.geometry = geometry
+        self.engine = QgsGeometry.createGeometryEngine(geometry.constGet())
+        self.engine.prepareGeometry()
+
+    def contains(self, point_geom):
+        return self.engine.contains(point_geom.constGet())
+
+    def distance(self, point_geom):
+        return self.engine.distance(point_geom.constGet())
+
+
 class SamplingWorker(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, list, int)
@@ -56,51 +83,25 @@ class SamplingWorker(QThread):
     def __init__(self, sampling_obj):
         super().__init__()
         self.sampling_obj = sampling_obj
-        self.is_cancelled = False
+        self._cancel = threading.Event()
         self.samples = []
         self.current_samples = []
+        self.last_emit = 0
 
     def run(self):
         # This method handles the main sampling loop for random point generation
         try:
-            extent = self.sampling_obj.sampling_area.extent()
-            attempts = 0
-            max_attempts = 5000
-            samples_generated = 0
-
-            # Keep trying until desired samples or max attempts are reached
-            while len(self.current_samples) < self.sampling_obj.num_samples and attempts < max_attempts:
-                if self.is_cancelled:
-                    # If user cancels, trigger the finished signal with no valid output
-                    self.finished.emit(False, [], attempts)
-                    return
-
-                # Generate random point within the sampling area's extent
-                x = random.uniform(extent.xMinimum(), extent.xMaximum())
-                y = random.uniform(extent.yMinimum(), extent.yMaximum())
-                point = QgsPointXY(x, y)
-                point_geom = QgsGeometry.fromPointXY(point)
-
-                # Ensure the point is actually within the sampling area polygon
-                if not any(f.geometry().contains(point_geom) for f in self.sampling_obj.sampling_area.getFeatures()):
-                    attempts += 1
-                    continue
-
-                # Verify distance constraints if set
-                is_valid = True
-                if self.sampling_obj.min_distance_samples > 0:
-                    for existing_point in self.current_samples:
-                        if point.distance(existing_point) < self.sampling_obj.min_distance_samples:
-                            is_valid = False
-                            break
-
-                # If valid, confirm additional checks and add point to current_samples
-                if is_valid and self.sampling_obj.is_valid_sample(point, show_warning=False, is_random=True):
-                    self.current_samples.append(point)
-                    samples_generated += 1
-                    self.progress.emit(samples_generated)
-
-                attempts += 1
+            rng = np.random.default_rng()
+            self.last_emit = 0
+            attempts = self.rejection_sampling(rng)
+
+            if attempts is None:
+                # If user cancels, trigger the finished signal with no valid output
+                self.finished.emit(False, [], 0)
+                return
+
+            if len(self.current_samples) > self.last_emit:
+                self.progress.emit(len(self.current_samples))
 
             # If not enough samples could be created, show a warning
             if len(self.current_samples) < self.sampling_obj.num_samples:
@@ -124,9 +125,63 @@ class SamplingWorker(QThread):
             # If an error occurs, finish with an error state
             self.finished.emit(False, [], 0)
 
+    def rejection_sampling(self, rng):
+        # Draws uniform candidates over the sampling area's extent until enough are accepted or
+        # the attempts run out. Returns the attempts made, or None if cancelled
+        extent = self.sampling_obj.sampling_area.extent()
+        xmin, xmax = extent.xMinimum(), extent.xMaximum()
+        ymin, ymax = extent.yMinimum(), extent.yMaximum()
+        cancel_requested = self._cancel.is_set
+        num_samples = self.sampling_obj.num_samples
+        min_distance_samples = self.sampling_obj.min_distance_samples
+        sample_grid = SampleGrid(min_distance_samples) if min_distance_samples > 0 else None
+        attempts = 0
+        max_attempts = 5000
+
+        # Keep trying until desired samples or max attempts are reached
+        while len(self.current_samples) < num_samples and attempts < max_attempts:
+            # Draw a batch of random candidates within the sampling area's extent
+            batch_size = min(CANDIDATE_BATCH_SIZE, max_attempts - attempts)
+            xs = rng.uniform(xmin, xmax, batch_size)
+            ys = rng.uniform(ymin, ymax, batch_size)
+
+            # Screen the whole batch against the sampling polygons' bounding boxes at once; only the
+            # survivors reach the Python loop and the prepared geometries
+            kept = np.flatnonzero(points_in_boxes(xs, ys, self.sampling_obj.area_boxes))
+            batch_attempts = batch_size
+
+            for checked, (index, x, y) in enumerate(zip(kept.tolist(), xs[kept].tolist(), ys[kept].tolist())):
+                if checked % CANCEL_CHECK_INTERVAL == 0 and cancel_requested():
+                    return None
+                if self.accept_candidate(x, y, sample_grid):
+                    if len(self.current_samples) >= num_samples:
+                        batch_attempts = index + 1
+                        break
+
+            attempts += batch_attempts
+        return attempts
+
+    def accept_candidate(self, x, y, sample_grid):
+        # Confirms a screened candidate against the sample spacing and the prepared geometries
+        if sample_grid is not None and not sample_grid.is_far_enough(x, y):
+            return False
+        point = QgsPointXY(x, y)
+        if not self.sampling_obj.is_valid_sample(point, show_warning=False, is_random=True):
+            return False
+        if sample_grid is not None:
+            sample_grid.add(x, y)
+        self.current_samples.append(point)
+        generated = len(self.current_samples)
+        # The final count is sent by run() once sampling is over, so the dialog never reaches its
+        # maximum while the worker is still running
+        if generated < self.sampling_obj.num_samples and generated - self.last_emit >= PROGRESS_EMIT_INTERVAL:
+            self.progress.emit(generated)
+            self.last_emit = generated
+        return True
+
     def stop(self):
-        # Sets a flag to cancel the ongoing sampling
-        self.is_cancelled = True
+        # Requests the cancellation of the ongoing sampling
+        self._cancel.set()
 
 class RandomSampling:
     def __init__(self, iface, ui):
@@ -139,8 +194,18 @@ class RandomSampling:
         self.min_distance_perimeter = 0
         self.min_distance_samples = 0
         self.min_distance_exclusion = 0
-        self.samples = []
+        # The samples are stored as parallel arrays of coordinates and temporary layer feature
+        # ids; the id is -1 while a sample is not on the layer
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._fids = np.empty(0, dtype=np.int64)
         self.temp_layer = None
+        # Indices of the ID and Samples attributes of the temporary layer
+        self._field_indices = None
+        # Label root the temporary layer features were last numbered with
+        self._numbered_label_root = None
+        # Set while a multi-step edit of the temporary layer defers its repaint
+        self._repaint_suspended = False
         self.label_root = ""
         self.selected_symbol = None
         self.selected_symbol_editable = None
@@ -150,6 +215,14 @@ class RandomSampling:
         self.worker = None
         self.progress_dialog = None
         self.layer_removed_connection = None
+        # Sampling area and exclusion geometries with their prepared engines (built lazily)
+        self.area_geoms = None
+        self.area_engines = None
+        self.area_boxes = None
+        self.area_boundaries = None
+        self.exclusion_geoms = None
+        self.exclusion_engines = None
+        self.exclusion_boxes = None
 
         # Disable controls at initialization
         self.disable_controls()
@@ -239,7 +312,6 @@ class RandomSampling:
             self.min_distance_samples = self.ui.doubleSpinBoxdistancesamples.value()
             self.min_distance_exclusion = self.ui.doubleSpinBoxdistanceexclusion.value()
             self.allow_outside_sampling = self.ui.checkBoxoutsidesamplingrandom.isChecked()
-            print(f"Updated min_distance_samples: {self.min_distance_samples}")
         except Exception as e:
             print(f"Error updating parameters: {str(e)}")
 
@@ -251,10 +323,64 @@ class RandomSampling:
     def set_sampling_area(self, layer):
         # Define the layer used as sampling area
         self.sampling_area = layer
+        self.area_geoms = None
+        self.area_engines = None
 
     def set_exclusion_zones(self, exclusion_layers):
         # Set exclusion zones (layers) that cannot contain points
         self.exclusion_zones = exclusion_layers
+        self.exclusion_geoms = None
+        self.exclusion_engines = None
+
+    def prepare_geometries(self):
+        # Fetches the sampling area and exclusion geometries once and prepares them for repeated tests
+        if self.area_engines is None:
+            # Only the geometries are needed, so skip fetching and converting the attributes
+            request = QgsFeatureRequest().setNoAttributes()
+            self.area_geoms = [f.geometry() for f in self.sampling_area.getFeatures(request)]
+            self.area_engines = [PreparedGeometry(geom) for geom in self.area_geoms]
+            self.area_boxes = bounding_boxes(self.area_geoms)
+            self.area_boundaries = [
+                PreparedGeometry(self.boundary_geometry(geom)) for geom in self.area_geoms
+            ]
+        if self.exclusion_engines is None:
+            request = QgsFeatureRequest().setNoAttributes()
+            self.exclusion_geoms = [
+                f.geometry() for zone in self.exclusion_zones for f in zone.getFeatures(request)
+            ]
+            self.exclusion_engines = [PreparedGeometry(geom) for geom in self.exclusion_geoms]
+            self.exclusion_boxes = bounding_boxes(self.exclusion_geoms)
+
+    @property
+    def samples(self):
+        # The samples as points, built from the coordinate arrays that store them
+        return [QgsPointXY(x, y) for x, y in zip(self._xs.tolist(), self._ys.tolist())]
+
+    def set_samples(self, samples):
+        # Replaces the samples and rebuilds the parallel arrays
+        self._xs = np.array([point.x() for point in samples], dtype=np.float64)
+        self._ys = np.array([point.y() for point in samples], dtype=np.float64)
+        self._fids = np.full(len(samples), -1, dtype=np.int64)
+
+    def append_sample(self, point, fid=-1):
+        # Adds one sample at the end of the parallel arrays
+        self._xs = np.append(self._xs, point.x())
+        self._ys = np.append(self._ys, point.y())
+        self._fids = np.append(self._fids, fid)
+
+    def drop_sample(self, index):
+        # Removes the sample at the given position from the parallel arrays
+        self._xs = np.delete(self._xs, index)
+        self._ys = np.delete(self._ys, index)
+        self._fids = np.delete(self._fids, index)
+
+    def nearest_sample_index(self, point):
+        # Position of the sample closest to the point, or None when there are no samples
+        if self._xs.size == 0:
+            return None
+        dx = self._xs - point.x()
+        dy = self._ys - point.y()
+        return int(np.argmin(dx * dx + dy * dy))
 
     def show_warning(self, title, message):
         # Convenient method to show a warning dialog
@@ -263,12 +389,12 @@ class RandomSampling:
     def handle_worker_finished(self, success, samples, attempts):
         # Callback for when the worker finishes random sampling
         if success:
-            self.samples = samples
+            self.set_samples(samples)
             # If samples exist, create a temporary layer to visualize them
-            if self.samples:
+            if self._xs.size:
                 self.create_temp_layer()
             # If fewer samples than requested, no further action needed here
-            if len(self.samples) < self.num_samples:
+            if self._xs.size < self.num_samples:
                 pass
             else:
                 QMessageBox.information(self.ui, "Success", f"{len(samples)} samples have been generated.")
@@ -284,9 +410,9 @@ class RandomSampling:
             # If there's already a temp layer with samples, prompt user
             if self.temp_layer is not None and not self.temp_layer.isValid():
                 self.temp_layer = None
-                self.samples = []
+                self.set_samples([])
 
-            if self.samples:
+            if self._xs.size:
                 QMessageBox.information(self.ui, "Info", "Samples already exist. Use 'Reset' button to generate a new set.")
                 return
 
@@ -295,14 +421,13 @@ class RandomSampling:
                 return
 
             self.update_parameters()
-            layer_name = self.ui.comboBoxshpsampling.currentText().split(" [")[0]
-            layers = QgsProject.instance().mapLayersByName(layer_name)
+            layer = self.ui._resolve_sampling_layer()
             
-            if not layers:
+            if not layer:
                 QMessageBox.warning(self.ui, "Error", "Sampling layer not found.")
                 return
                 
-            self.set_sampling_area(layers[0])
+            self.set_sampling_area(layer)
             exclusion_layers = []
             
             # Collect all exclusion zone layers from the list widget
@@ -343,13 +468,17 @@ class RandomSampling:
                 QMessageBox.information(self.ui, "Info", "Samples already exist. Use 'Reset' button to generate a new set.")
                 return None
 
-            self.samples = []
+            self.set_samples([])
+            self.prepare_geometries()
             
             # Create a progress dialog to show the sampling progress
             self.progress_dialog = QProgressDialog("Generating random samples...", "Cancel", 0, self.num_samples, self.ui)
             self.progress_dialog.setWindowTitle("Progress")
             self.progress_dialog.setWindowModality(Qt.WindowModal)
             self.progress_dialog.setMinimumDuration(0)
+            # Only handle_worker_finished closes the dialog, even once the progress reaches the maximum
+            self.progress_dialog.setAutoReset(False)
+            self.progress_dialog.setAutoClose(False)
 
             # Create and configure the worker
             self.worker = SamplingWorker(self)
@@ -363,7 +492,7 @@ class RandomSampling:
             result = self.progress_dialog.exec_()
             if result == QProgressDialog.Rejected:
                 self.worker.stop()
-            return (self.samples, len(self.samples))
+            return (self.samples, int(self._xs.size))
 
         except Exception as e:
             QMessageBox.critical(self.ui, "Error", f"Error generating samples: {str(e)}")
@@ -374,18 +503,17 @@ class RandomSampling:
         try:
             if self.temp_layer is not None and not self.temp_layer.isValid():
                 self.temp_layer = None
-                self.samples = []
+                self.set_samples([])
 
             self.update_parameters()
             
-            layer_name = self.ui.comboBoxshpsampling.currentText().split(" [")[0]
-            layers = QgsProject.instance().mapLayersByName(layer_name)
+            layer = self.ui._resolve_sampling_layer()
             
-            if not layers:
+            if not layer:
                 QMessageBox.warning(self.ui, "Error", "Sampling layer not found.")
                 return
                     
-            self.set_sampling_area(layers[0])
+            self.set_sampling_area(layer)
             
             exclusion_layers = []
             for i in range(self.ui.listWidgetexclusion.count()):
@@ -414,7 +542,7 @@ class RandomSampling:
 
     def on_pushButtonrandomsave_clicked(self):
         # Saves the generated samples to a shapefile
-        if not self.samples:
+        if not self._xs.size:
             QMessageBox.warning(self.ui, "Error", "No samples to save. Please generate samples first.")
             return
 
@@ -442,21 +570,30 @@ class RandomSampling:
     def save_samples(self, output_dir, filename):
         # Writes the temporary layer to disk as a shapefile and adds it to the project
         try:
-            if not self.temp_layer or not self.samples:
+            if not self.temp_layer or not self._xs.size:
                 return False
 
-            self.renumber_samples()
             output_path = os.path.join(output_dir, f"{filename}.shp")
+            fields = self.temp_layer.fields()
 
             options = QgsVectorFileWriter.SaveVectorOptions()
             options.driverName = "ESRI Shapefile"
             options.fileEncoding = "UTF-8"
 
-            error = QgsVectorFileWriter.writeAsVectorFormat(
-                self.temp_layer, output_path, options
+            # Write the samples straight from memory, numbered in their current order,
+            # instead of renumbering the temporary layer and exporting it
+            writer = QgsVectorFileWriter.create(
+                output_path, fields, QgsWkbTypes.Point, self.temp_layer.crs(),
+                QgsProject.instance().transformContext(), options
             )
-
-            if error[0] == QgsVectorFileWriter.NoError:
+            error = writer.hasError()
+            if error == QgsVectorFileWriter.NoError:
+                writer.addFeatures(self.sample_features(fields))
+                error = writer.hasError()
+            # Deleting the writer flushes and closes the file
+            del writer
+
+            if error == QgsVectorFileWriter.NoError:
                 new_layer = QgsVectorLayer(output_path, filename, "ogr")
                 if new_layer.isValid():
                     QgsProject.instance().addMapLayer(new_layer)
@@ -497,7 +634,7 @@ class RandomSampling:
             if self.layer_removed_connection:
                 QgsProject.instance().layerWillBeRemoved.disconnect(self.on_layer_removed)
                 self.layer_removed_connection = None
-        self.samples = []
+        self.set_samples([])
         self.temp_layer = None
         if self.worker:
             self.worker.stop()
@@ -505,82 +642,92 @@ class RandomSampling:
 
     def is_valid_sample(self, point, show_warning=True, is_manual=False, is_random=False):
         # Checks if a potential point satisfies all constraints (area, distances, etc.)
-        point_geom = QgsGeometry.fromPointXY(point)
-        print(f"Checking sample with min_distance_samples: {self.min_distance_samples}")
+        self.prepare_geometries()
+        x, y = point.x(), point.y()
+        # The point geometry is only built once a check actually needs GEOS
+        point_geom = None
+
+        # Find the sampling polygon holding the point once; both the area and perimeter checks use it
+        needs_area = self.min_distance_perimeter > 0 or (
+            not self.allow_outside_sampling if is_manual else is_random
+        )
+        area_index = None
+        if needs_area:
+            point_geom = QgsGeometry.fromPointXY(point)
+            area_index = self.containing_area(point_geom, x, y)
 
         # If user is manually placing a point and outside-sampling is not allowed, ensure it's inside the area
         if is_manual:
             if not self.allow_outside_sampling:
-                if not any(f.geometry().contains(point_geom) for f in self.sampling_area.getFeatures()):
+                if area_index is None:
                     if show_warning:
                         QMessageBox.warning(self.ui, "Invalid Location", 
                                           "Point is outside sampling area.")
                     return False
         elif is_random:
             # Random point must be inside the area to be valid
-            if not any(f.geometry().contains(point_geom) for f in self.sampling_area.getFeatures()):
+            if area_index is None:
                 return False
 
-        # Check if the point lies in an exclusion zone or too close to it
-        if self.exclusion_zones:
-            for zone in self.exclusion_zones:
-                for feature in zone.getFeatures():
-                    # If point is inside an exclusion zone, reject it
-                    if feature.geometry().contains(point_geom):
-                        if show_warning:
-                            QMessageBox.warning(self.ui, "Invalid Location", 
-                                             "Point is in exclusion zone.")
-                        return False
-                    
-                    # If there's a minimum distance from exclusion zones, check that too
-                    if self.min_distance_exclusion > 0:
-                        if feature.geometry().distance(point_geom) < self.min_distance_exclusion:
-                            if show_warning:
-                                QMessageBox.warning(self.ui, "Invalid Location", 
-                                                 f"Point too close to exclusion zone (min: {self.min_distance_exclusion}m)")
-                            return False
+        # Check if the point lies in an exclusion zone or too close to it. Only zones whose bounding
+        # box, grown by the exclusion distance, holds the point can reject it
+        nearby = boxes_near_point(self.exclusion_boxes, x, y, self.min_distance_exclusion)
+        if nearby.size and point_geom is None:
+            point_geom = QgsGeometry.fromPointXY(point)
+        for index in nearby.tolist():
+            engine = self.exclusion_engines[index]
+            # If point is inside an exclusion zone, reject it
+            if engine.contains(point_geom):
+                if show_warning:
+                    QMessageBox.warning(self.ui, "Invalid Location", 
+                                     "Point is in exclusion zone.")
+                return False
+            
+            # If there's a minimum distance from exclusion zones, check that too
+            if self.min_distance_exclusion > 0:
+                if engine.distance(point_geom) < self.min_distance_exclusion:
+                    if show_warning:
+                        QMessageBox.warning(self.ui, "Invalid Location", 
+                                         f"Point too close to exclusion zone (min: {self.min_distance_exclusion}m)")
+                    return False
 
         # Check if point is too close to the perimeter of the sampling area
-        if self.min_distance_perimeter > 0:
-            for feature in self.sampling_area.getFeatures():
-                if feature.geometry().contains(point_geom):
-                    if self.calculate_distance_to_boundary(feature.geometry(), point_geom) < self.min_distance_perimeter:
-                        if show_warning:
-                            QMessageBox.warning(self.ui, "Invalid Location", 
-                                             f"Point too close to perimeter (min: {self.min_distance_perimeter}m)")
-                        return False
-                    break
+        if self.min_distance_perimeter > 0 and area_index is not None:
+            if self.area_boundaries[area_index].distance(point_geom) < self.min_distance_perimeter:
+                if show_warning:
+                    QMessageBox.warning(self.ui, "Invalid Location", 
+                                     f"Point too close to perimeter (min: {self.min_distance_perimeter}m)")
+                return False
 
         # Check if point is too close to an existing sample
-        if self.min_distance_samples > 0 and self.samples:
-            for existing_point in self.samples:
-                distance = point.distance(existing_point)
-                if distance < self.min_distance_samples:
-                    if show_warning:
-                        QMessageBox.warning(self.ui, "Invalid Location", 
-                                         f"Point too close to another sample (min: {self.min_distance_samples}m)")
-                    print(f"Sample rejected - too close: {distance} < {self.min_distance_samples}")
-                    return False
-            print(f"Sample accepted - min distance check passed")
+        if self.min_distance_samples > 0 and self._xs.size:
+            # Compare squared distances so no square root is taken
+            dx = self._xs - point.x()
+            dy = self._ys - point.y()
+            if (dx * dx + dy * dy).min() < self.min_distance_samples * self.min_distance_samples:
+                if show_warning:
+                    QMessageBox.warning(self.ui, "Invalid Location", 
+                                     f"Point too close to another sample (min: {self.min_distance_samples}m)")
+                return False
 
         return True
 
-    def calculate_distance_to_boundary(self, geometry, point_geom):
-        # Calculates the shortest distance from a point to the boundary of a polygon
+    def containing_area(self, point_geom, x, y):
+        # Index of the first sampling polygon containing the point, or None when outside all of them.
+        # Polygons whose bounding box misses the point are skipped without a GEOS call
+        candidates = boxes_near_point(self.area_boxes, x, y)
+        for index in candidates.tolist():
+            if self.area_engines[index].contains(point_geom):
+                return index
+        return None
+
+    def boundary_geometry(self, geometry):
+        # Builds the rings of a polygon as one multi-polyline, so the distance from a point to the
+        # perimeter is a single call. Non-polygon geometries are measured directly
         if geometry.type() == QgsWkbTypes.PolygonGeometry:
-            if geometry.isMultipart():
-                distances = [
-                    QgsGeometry.fromPolylineXY(ring).distance(point_geom)
-                    for polygon in geometry.asMultiPolygon()
-                    for ring in polygon
-                ]
-                return min(distances) if distances else float('inf')
-            else:
-                return min(
-                    QgsGeometry.fromPolylineXY(ring).distance(point_geom)
-                    for ring in geometry.asPolygon()
-                )
-        return geometry.distance(point_geom)
+            polygons = geometry.asMultiPolygon() if geometry.isMultipart() else [geometry.asPolygon()]
+            return QgsGeometry.fromMultiPolylineXY([ring for polygon in polygons for ring in polygon])
+        return geometry
 
     def create_temp_layer(self):
         # Creates an in-memory layer to temporarily hold sampled points
@@ -602,18 +749,15 @@ class RandomSampling:
                 QgsField("Y", QVariant.Double)
             ])
             self.temp_layer.updateFields()
-
-            # Populate layer with sampled points
-            features = []
-            for i, point in enumerate(self.samples, 1):
-                feature = QgsFeature(self.temp_layer.fields())
-                feature.setGeometry(QgsGeometry.fromPointXY(point))
-                feature.setAttributes([
-                    i, f"{self.label_root}{i}", point.x(), point.y()
-                ])
-                features.append(feature)
-
-            provider.addFeatures(features)
+            # Resolve the attribute indices once; renumbering writes to them on every edit
+            fields = self.temp_layer.fields()
+            self._field_indices = tuple(fields.lookupField(name) for name in ('ID', 'Samples'))
+
+            # Populate layer with sampled points in one bulk insert
+            self._numbered_label_root = self.label_root
+            # The added features carry their assigned fids, which renumbering relies on
+            _, added = provider.addFeatures(self.sample_features(self.temp_layer.fields()))
+            self._fids = np.array([feature.id() for feature in added], dtype=np.int64)
             self.temp_layer.updateExtents()
 
             # Assign a basic symbol if none is specifically chosen
@@ -627,8 +771,10 @@ class RandomSampling:
 
             QgsProject.instance().addMapLayer(self.temp_layer)
 
-            # Track if layer is removed
-            self.layer_removed_connection = QgsProject.instance().layerWillBeRemoved.connect(self.on_layer_removed)
+            # Track if layer is removed; the connection outlives a manually removed layer,
+            # so it is only made once
+            if not self.layer_removed_connection:
+                self.layer_removed_connection = QgsProject.instance().layerWillBeRemoved.connect(self.on_layer_removed)
 
             # Set custom map tool to allow adding/removing points by clicking
             self.map_tool = SamplingMapTool(self.iface.mapCanvas(), self)
@@ -637,6 +783,24 @@ class RandomSampling:
         except Exception as e:
             QMessageBox.critical(self.ui, "Error", f"Error creating temporary layer: {str(e)}")
 
+    def sample_features(self, fields):
+        # Builds one feature per sample, numbered in order, straight from the coordinate arrays.
+        # The attribute rows are prepared up front so the feature loop only copies them
+        ids = np.arange(1, self._xs.size + 1).tolist()
+        xs = self._xs.tolist()
+        ys = self._ys.tolist()
+        rows = [
+            [sample_id, f"{self.label_root}{sample_id}", x, y]
+            for sample_id, x, y in zip(ids, xs, ys)
+        ]
+        features = []
+        for row, x, y in zip(rows, xs, ys):
+            feature = QgsFeature(fields)
+            feature.setGeometry(QgsGeometry(QgsPoint(x, y)))
+            feature.setAttributes(row)
+            features.append(feature)
+        return features
+
     def on_layer_removed(self, layer_id):
         # If the temporary layer is removed manually, clear the reference
         if self.temp_layer and self.temp_layer.id() == layer_id:
@@ -653,63 +817,69 @@ class RandomSampling:
         if not self.is_valid_sample(point, show_warning=True, is_manual=True):
             return
 
-        self.samples.append(point)
-
+        x, y = point.x(), point.y()
         feature = QgsFeature(self.temp_layer.fields())
-        feature.setGeometry(QgsGeometry.fromPointXY(point))
+        feature.setGeometry(QgsGeometry(QgsPoint(x, y)))
         feature.setAttributes([
-            len(self.samples),
-            f"{self.label_root}{len(self.samples)}",
-            point.x(),
-            point.y()
+            self._xs.size + 1,
+            f"{self.label_root}{self._xs.size + 1}",
+            x,
+            y
         ])
-        self.temp_layer.dataProvider().addFeatures([feature])
-        self.temp_layer.updateExtents()
-        self.renumber_samples()
+        with self._suspend_repaint():
+            _, added = self.temp_layer.dataProvider().addFeatures([feature])
+            self.append_sample(point, added[0].id())
+            # The new sample was written with its final number and the samples before it keep
+            # theirs, so only a changed label root leaves anything to renumber
+            self.renumber_samples(self._xs.size)
 
     def remove_sample(self, point):
         # Allows user to manually remove the nearest sample point on right-click
-        nearest_feature = None
-        min_distance = float('inf')
-        nearest_point = None
-
-        for feature in self.temp_layer.getFeatures():
-            distance = feature.geometry().distance(QgsGeometry.fromPointXY(point))
-            if distance < min_distance:
-                min_distance = distance
-                nearest_feature = feature
-                nearest_point = feature.geometry().asPoint()
-
-        if nearest_feature:
-            self.temp_layer.dataProvider().deleteFeatures([nearest_feature.id()])
-            self.temp_layer.updateExtents()
+        index = self.nearest_sample_index(point)
+        if index is None:
+            return
+
+        with self._suspend_repaint():
+            fid = int(self._fids[index])
+            if fid >= 0:
+                self.temp_layer.dataProvider().deleteFeatures([fid])
 
-            if nearest_point in self.samples:
-                self.samples.remove(nearest_point)
+            self.drop_sample(index)
+            # Only the samples after the removed one shift down by one
+            self.renumber_samples(index)
 
+    @contextmanager
+    def _suspend_repaint(self):
+        # Defers extent updates and repaints of the temporary layer to the end of a multi-step
+        # edit, so the canvas redraws once per click
+        self._repaint_suspended = True
+        try:
+            yield
+        finally:
+            self._repaint_suspended = False
+            self.temp_layer.updateExtents()
             self.temp_layer.triggerRepaint()
-            self.renumber_samples()
 
-    def renumber_samples(self):
-        # Updates attribute table IDs and labels after adding/removing points
-        point_to_feature_id = {
-            (feature.geometry().asPoint().x(), feature.geometry().asPoint().y()): feature.id()
-            for feature in self.temp_layer.getFeatures()
+    def renumber_samples(self, start=0):
+        # Updates attribute table IDs and labels after adding/removing points, from the sample at
+        # position `start` onwards. The feature ids are tracked alongside the samples, so no
+        # feature scan is needed to find them. A changed label root relabels every sample
+        if self.label_root != self._numbered_label_root:
+            start = 0
+            self._numbered_label_root = self.label_root
+        # A feature keeps its coordinates, so only the ID and label attributes are rewritten
+        id_idx, samples_idx = self._field_indices
+        updates = {
+            fid: {id_idx: i, samples_idx: f"{self.label_root}{i}"}
+            for i, fid in enumerate(self._fids[start:].tolist(), start + 1)
+            if fid >= 0
         }
-
-        updates = {}
-        for i, point in enumerate(self.samples, 1):
-            feature_id = point_to_feature_id.get((point.x(), point.y()))
-            if feature_id is not None:
-                updates[feature_id] = {
-                    self.temp_layer.fields().lookupField('ID'): i,
-                    self.temp_layer.fields().lookupField('Samples'): f"{self.label_root}{i}",
-                    self.temp_layer.fields().lookupField('X'): point.x(),
-                    self.temp_layer.fields().lookupField('Y'): point.y()
-                }
+        if not updates:
+            return
 
         self.temp_layer.dataProvider().changeAttributeValues(updates)
-        self.temp_layer.triggerRepaint()
+        if not self._repaint_suspended:
+            self.temp_layer.triggerRepaint()
 
 class SamplingMapTool(QgsMapTool):
     def __init__(self, canvas, sampling):
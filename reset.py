@@ -35,6 +35,8 @@
  ***************************************************************************/
 """
 
+from contextlib import contextmanager
+
 # Import necessary Qt widgets
 from qgis.PyQt.QtWidgets import (
     QCheckBox, QSpinBox, QDoubleSpinBox, QLineEdit, QPushButton, QRadioButton,
@@ -99,22 +101,8 @@ class ResetFunction:
             self.dialog.lineEditEPSGcode
         ]
 
-        # Collect all checkboxes
-        self.all_checkboxes = [
-            self.dialog.checkBoxaddsamplesmanually,
-            self.dialog.checkBoxaddsamplesbycoordinates,
-            self.dialog.checkBoxaddsamplesbyfile,
-            self.dialog.checkBoxaddsamplesrandomly,
-            self.dialog.checkBoxaddsamplessystematically,
-            self.dialog.checkBoxaddstratifiedsamplesrandomly,
-            self.dialog.checkBoxaddstratifiedsamplessystematically,
-            self.dialog.checkBoxaddclustersamplesrandomly,
-            self.dialog.checkBoxaddclustersamplessystematically,
-            self.dialog.checkBoxshpsamplingarea,
-            self.dialog.checkBoxgenerateshpbycoordinates,
-            self.dialog.checkBoxstratapolyline,
-            self.dialog.checkBoxstratavoronoi,
-            self.dialog.checkBoxstratalines,
+        # Collect all checkboxes (the function checkboxes followed by the option checkboxes)
+        self.all_checkboxes = self.function_checkboxes + [
             self.dialog.checkBoxoutsidesampling,
             self.dialog.checkBoxoutsidesamplingrandom,
             self.dialog.checkBoxoutsidesampling_systematic,
@@ -191,18 +179,47 @@ class ResetFunction:
             self.dialog.comboBoxcolumny
         ]
 
+        # Widgets whose change signals only reach parameter placeholders, so they can be reset
+        # with signals blocked. Checkboxes, radio buttons, line edits and combo boxes keep their
+        # signals because their handlers tear down sampling modes and sync labels and symbols
+        self.quiet_widgets = self.all_spinboxes + self.all_doublespinboxes + self.all_listwidgets
+
+        # Resolve once which call resets each widget, so resets only replay (method, value) pairs
+        self._shared_reset_actions = self._reset_actions_for(
+            self.shared_outside_manual + self.shared_stratified + self.shared_cluster + self.shared_epsg
+        )
+        self._full_reset_actions = (
+            [(cb.setChecked, False) for cb in self.all_checkboxes]
+            + [(rb.setChecked, False) for rb in self.all_radiobuttons]
+            + [(sb.setValue, 0) for sb in self.all_spinboxes]
+            + [(dsb.setValue, 0.0) for dsb in self.all_doublespinboxes]
+            + [(le.clear, None) for le in self.all_lineedits]
+            + [(lw.clear, None) for lw in self.all_listwidgets]
+        )
+
+    @contextmanager
+    def _batched_reset(self):
+        # Resets widgets in one pass: repaints are suspended and the quiet widgets' signals are
+        # blocked until the block ends, so the dialog refreshes once instead of per widget
+        self.dialog.setUpdatesEnabled(False)
+        blocked = [w.blockSignals(True) for w in self.quiet_widgets]
+        try:
+            yield
+        finally:
+            for w, was_blocked in zip(self.quiet_widgets, blocked):
+                w.blockSignals(was_blocked)
+            self.dialog.setUpdatesEnabled(True)
+
     def reset_all(self):
-        # Reset function checkboxes
-        for cb in self.function_checkboxes:
-            cb.blockSignals(True)
-            cb.setChecked(False)
-            cb.blockSignals(False)
-            
-        # Reset shared widget groups
-        self._reset_widgets(self.shared_outside_manual)
-        self._reset_widgets(self.shared_stratified)
-        self._reset_widgets(self.shared_cluster)
-        self._reset_widgets(self.shared_epsg)
+        with self._batched_reset():
+            # Reset function checkboxes
+            for cb in self.function_checkboxes:
+                cb.blockSignals(True)
+                cb.setChecked(False)
+                cb.blockSignals(False)
+
+            # Reset shared widget groups
+            self._apply_reset_actions(self._shared_reset_actions)
         
         # Re-initialize controls on the dialog
         self.dialog.initialize_controls()
@@ -211,17 +228,28 @@ class ResetFunction:
         if not self.dialog.checkBoxaddsamplesrandomly.isChecked():
             self.dialog.random_sampling.disable_controls()
 
-    def _reset_widgets(self, widget_list):
-        # Helper method to reset widgets in a given list
+    def _reset_actions_for(self, widget_list):
+        # Helper method to pair each resettable widget in a list with its reset call
+        actions = []
         for w in widget_list:
             if isinstance(w, QCheckBox) or isinstance(w, QRadioButton):
-                w.setChecked(False)
+                actions.append((w.setChecked, False))
             elif isinstance(w, QSpinBox):
-                w.setValue(0)
+                actions.append((w.setValue, 0))
             elif isinstance(w, QDoubleSpinBox):
-                w.setValue(0.0)
+                actions.append((w.setValue, 0.0))
             elif isinstance(w, QLineEdit):
-                w.clear()
+                actions.append((w.clear, None))
+        return actions
+
+    @staticmethod
+    def _apply_reset_actions(actions):
+        # Replays precomputed reset calls; a None value means the call takes no argument
+        for fn, arg in actions:
+            if arg is None:
+                fn()
+            else:
+                fn(arg)
 
     def full_plugin_reset(self):
         # Full reset triggered by a confirmation dialog
@@ -234,55 +262,7 @@ class ResetFunction:
         )
 
         if reply == QMessageBox.Yes:
-            # Reset all checkboxes
-            for cb in self.all_checkboxes:
-                cb.setChecked(False)
-
-            # Reset all radio buttons
-            for rb in self.all_radiobuttons:
-                rb.setChecked(False)
-
-            # Reset all spin boxes
-            for sb in self.all_spinboxes:
-                sb.setValue(0)
-
-            # Reset all double spin boxes
-            for dsb in self.all_doublespinboxes:
-                dsb.setValue(0.0)
-
-            # Clear all line edits
-            for le in self.all_lineedits:
-                le.clear()
-
-            # Clear all list widgets
-            for lw in self.all_listwidgets:
-                lw.clear()
-
-            # Reset combo boxes to first index if available
-            for cb in self.all_comboboxes:
-                if cb.count() > 0:
-                    cb.setCurrentIndex(0)
-
-            # Repopulate shapefile layers
-            self.dialog.layer_module.populate_shapefile_layers()
-
-            # Remove temporary layers if they exist
-            if hasattr(self.dialog, "area_exclusion") and self.dialog.area_exclusion:
-                if hasattr(self.dialog.area_exclusion, "temp_sampling_layer") and self.dialog.area_exclusion.temp_sampling_layer:
-                    QgsProject.instance().removeMapLayer(self.dialog.area_exclusion.temp_sampling_layer.id())
-                    self.dialog.area_exclusion.temp_sampling_layer = None
-                if hasattr(self.dialog.area_exclusion, "temp_coordinates_layer") and self.dialog.area_exclusion.temp_coordinates_layer:
-                    QgsProject.instance().removeMapLayer(self.dialog.area_exclusion.temp_coordinates_layer.id())
-                    self.dialog.area_exclusion.temp_coordinates_layer = None
-                if hasattr(self.dialog.area_exclusion, "coordinates"):
-                    self.dialog.area_exclusion.coordinates = []
-
-            # Re-initialize controls
-            self.dialog.initialize_controls()
-            
-            # Disable random sampling controls if not selected
-            if not self.dialog.checkBoxaddsamplesrandomly.isChecked():
-                self.dialog.random_sampling.disable_controls()
+            self._do_full_reset()
 
             # Notify the user of successful reset
             QMessageBox.information(
@@ -293,42 +273,41 @@ class ResetFunction:
 
     def silent_full_reset(self):
         # Full reset without displaying any confirmation or info messages
-        for cb in self.all_checkboxes:
-            cb.setChecked(False)
+        self._do_full_reset()
 
-        for rb in self.all_radiobuttons:
-            rb.setChecked(False)
+    def _do_full_reset(self):
+        # Resets every control, removes the temporary layers and re-initializes the dialog
+        with self._batched_reset():
+            # Reset all checkboxes, radio buttons, spin boxes, line edits and list widgets
+            self._apply_reset_actions(self._full_reset_actions)
 
-        for sb in self.all_spinboxes:
-            sb.setValue(0)
-
-        for dsb in self.all_doublespinboxes:
-            dsb.setValue(0.0)
-
-        for le in self.all_lineedits:
-            le.clear()
-
-        for lw in self.all_listwidgets:
-            lw.clear()
-
-        for cb in self.all_comboboxes:
-            if cb.count() > 0:
-                cb.setCurrentIndex(0)
+            # Reset combo boxes to first index if available
+            for cb in self.all_comboboxes:
+                if cb.count() > 0:
+                    cb.setCurrentIndex(0)
 
+        # Repopulate shapefile layers
         self.dialog.layer_module.populate_shapefile_layers()
 
+        # Remove temporary layers if they exist
         if hasattr(self.dialog, "area_exclusion") and self.dialog.area_exclusion:
-            if hasattr(self.dialog.area_exclusion, "temp_sampling_layer") and self.dialog.area_exclusion.temp_sampling_layer:
-                QgsProject.instance().removeMapLayer(self.dialog.area_exclusion.temp_sampling_layer.id())
+            layer_ids = [layer.id() for layer in (
+                getattr(self.dialog.area_exclusion, "temp_sampling_layer", None),
+                getattr(self.dialog.area_exclusion, "temp_coordinates_layer", None)) if layer]
+            if layer_ids:
+                # Removes both layers in one call so the project and canvas update once
+                QgsProject.instance().removeMapLayers(layer_ids)
+            if hasattr(self.dialog.area_exclusion, "temp_sampling_layer"):
                 self.dialog.area_exclusion.temp_sampling_layer = None
-            if hasattr(self.dialog.area_exclusion, "temp_coordinates_layer") and self.dialog.area_exclusion.temp_coordinates_layer:
-                QgsProject.instance().removeMapLayer(self.dialog.area_exclusion.temp_coordinates_layer.id())
+            if hasattr(self.dialog.area_exclusion, "temp_coordinates_layer"):
                 self.dialog.area_exclusion.temp_coordinates_layer = None
             if hasattr(self.dialog.area_exclusion, "coordinates"):
                 self.dialog.area_exclusion.coordinates = []
 
+        # Re-initialize controls
         self.dialog.initialize_controls()
-        
+
+        # Disable random sampling controls if not selected
         if not self.dialog.checkBoxaddsamplesrandomly.isChecked():
             self.dialog.random_sampling.disable_controls()
 
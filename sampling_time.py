@@ -47,9 +47,8 @@ from qgis.PyQt.QtWidgets import QAction
 from .resources import *
 # This imports resources used by the plugin
 
-# Import the code for the dialog
-from .sampling_time_dialog import SamplingDialog
-# Imports the dialog that contains the plugin's GUI
+from qgis.core import Qgis, QgsMessageLog
+# Writes errors to the QGIS message log
 
 import os.path
 # Allows interaction with the file system
@@ -68,7 +67,6 @@ class Sampling:
         """
         # Save reference to the QGIS interface
         self.iface = iface
-        print(f"self.iface in sampling_time.py __init__: {'available' if self.iface else 'not available'}")
 
         # Initialize plugin directory
         self.plugin_dir = os.path.dirname(__file__)
@@ -169,17 +167,15 @@ class Sampling:
     def run(self):
         """Run method that performs all the real work."""
         # Triggered when user clicks the plugin's action
-        print("\n=== STARTING PLUGIN ===")
         try:
-            print("1. Checking self.dlg")
             if self.dlg is None:
-                print("2. Creating new dialog")
+                # The dialog module is imported on first use so loading the plugin stays cheap
+                from .sampling_time_dialog import SamplingDialog
                 self.dlg = SamplingDialog(self.iface)
-                print("3. Dialog created successfully")
-            else:
-                print("2. Using existing dialog")
-            
-            print("4. Preparing to display dialog")
+            elif not self.dlg.isVisible():
+                # The dialog is reused across opens; refresh the layer list since the project may have changed
+                self.dlg.layer_module.populate_shapefile_layers()
+
             # Ensures dialog is restored if minimized
             if self.dlg.windowState() & Qt.WindowMinimized:
                 self.dlg.setWindowState(self.dlg.windowState() & ~Qt.WindowMinimized)
@@ -187,12 +183,9 @@ class Sampling:
             self.dlg.show()
             self.dlg.raise_()
             self.dlg.activateWindow()
-            print("5. Dialog displayed")
             
-        except Exception as e:
-            print("\n=== PLUGIN ERROR ===")
-            print(f"Error: {str(e)}")
+        except Exception:
+            # Logs the full traceback so a failure to open the dialog can be diagnosed
             import traceback
-            print("Complete Traceback:")
-            print(traceback.format_exc())
+            QgsMessageLog.logMessage(traceback.format_exc(), 'Sampling Time', level=Qgis.Critical)
             return
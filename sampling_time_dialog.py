@@ -34,13 +34,15 @@ import os
 import sys
 import webbrowser
 import subprocess
+from functools import cached_property, lru_cache, partial
+from pathlib import Path
 from qgis.PyQt import uic, QtWidgets
 from qgis.PyQt.QtGui import QIcon, QPixmap
 from qgis.PyQt.QtWidgets import (
     QMessageBox, QFileDialog, QListWidgetItem, QInputDialog, QLineEdit,
 )
-from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
-from qgis.PyQt.QtCore import Qt
+from qgis.core import Qgis, QgsMessageLog, QgsProject, QgsVectorLayer, QgsWkbTypes
+from qgis.PyQt.QtCore import Qt, QObject, QEvent
 
 # Importing various sampling modules that implement different sampling methods
 from .judgmental import JudgmentalSampling
@@ -48,17 +50,155 @@ from .random import RandomSampling
 from .systematic import SystematicSampling
 from .stratified_random import StratifiedRandomSampling
 from .cluster_random import ClusterRandomSampling
-from .generate_shapefile import Stratifiedshapefile
 from .generate_areaexclusion import AreaExclusionModule
 from .stratified_systematic import StratifiedSystematicSampling
 from .cluster_systematic import ClusterSystematicSampling
 from .reset import ResetFunction
 
+# Plugin directory and the symbol folders, resolved once when the module loads
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+SYMBOL_DIR = os.path.join(PLUGIN_DIR, "symbol_icon")
+SYMBOL_DIR_EDITABLE = os.path.join(PLUGIN_DIR, "symbol_icon2")
+LICENSE_PATH = os.path.join(PLUGIN_DIR, "LICENSE.txt")
+LICENSE_URL = Path(LICENSE_PATH).as_uri()
+# (name, svg_path, svg_path_editable) for each of the plugin's symbols
+SYMBOL_PATHS = [
+    (
+        f"Symbol {i}",
+        os.path.join(SYMBOL_DIR, f"Symbol {i}.svg"),
+        os.path.join(SYMBOL_DIR_EDITABLE, f"Symbol {i}.svg"),
+    )
+    for i in range(1, 11)
+]
+
+# Styles and text of the "About" dialog
+ABOUT_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #cccaca;
+        border: 2px solid #080808;
+        border-radius: 10px;
+    }
+    QLabel {
+        color: #2c3e50;
+        padding: 10px;
+        background-color: white;
+        border-radius: 5px;
+    }
+    QPushButton {
+        background-color: #080808;
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #545454;
+    }
+    QPushButton:pressed {
+        background-color: #080808;
+    }
+"""
+ABOUT_TITLE_STYLESHEET = """
+    font-size: 18px;
+    font-weight: bold;
+    color: #080808;
+    background-color: transparent;
+"""
+ABOUT_TEXT_STYLESHEET = """
+    font-size: 12px;
+    font-weight: bold;
+    color: #080808;
+    padding: 14px;
+    background-color: white;
+    border-radius: 5px;
+"""
+ABOUT_HTML = """<b>A comprehensive QGIS plugin for automated area sampling
+using judgmental, random, systematic, stratified, and cluster techniques.
+This plugin enables the creation of sampling areas, exclusion zones, customizable
+stratification and clustering, and generates shapefiles for outputs.
+Designed for precision and adaptability in geospatial workflows.</b><br><br>
+
+Version: 1.1.0 2025-05-19<br>
+Begin: 2024-09-29<br>
+Author: Marcel A. Cedrez Dacosta<br>
+Contact: marcel.a@giscourse.online<br><br>
+
+<b>How to use the plugin:</b>
+<a href="https://giscourse.online/qgis-sampling-time-plugin/">
+https://giscourse.online/qgis-sampling-time-plugin/
+</a><br><br>
+
+License: This plugin is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.<br><br>
+
+Sampling Time Plugin is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU General Public License for more details.
+"""
+
 # Load the UI definition from the .ui file created with Qt Designer
 FORM_CLASS, _ = uic.loadUiType(
-    os.path.join(os.path.dirname(__file__), "sampling_time_dialog_base.ui")
+    os.path.join(PLUGIN_DIR, "sampling_time_dialog_base.ui")
 )
 
+# Icons shared across populate calls, keyed by file or resource path
+_ICON_CACHE = {}
+
+# Layer icons by geometry type, built on first use once Qt resources are loaded;
+# the None entry is the empty icon used for other geometry types
+_GEOMETRY_ICONS = {}
+
+
+def cached_icon(path):
+    """
+    Returns the icon for the given path, creating it only the first time it is requested.
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
+
+@lru_cache(maxsize=1)
+def license_file_exists():
+    """
+    Returns whether the license file is present; checked once per session,
+    so a missing file is not looked up again on every click either.
+    """
+    try:
+        os.stat(LICENSE_PATH)
+    except OSError:
+        return False
+    return True
+
+
+def symbol_file_names(folder):
+    """
+    Returns the names of the files in the given folder, or an empty set if it cannot be read.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+class SymbolPopupFilter(QObject):
+    """
+    Event filter that calls back when the symbol combo box list is shown,
+    so the symbol icons are only loaded once the user opens it.
+    """
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Show:
+            self.callback()
+        return False
+
 
 class SamplingLayerModule:
     """
@@ -91,6 +231,8 @@ class SamplingLayerModule:
         self.sample_label_root = ""
         self.selected_symbol = None
         self.selected_symbol_editable = None
+        # (svg_path, svg_path_editable) for each row of the symbol combo box
+        self.symbol_data_by_index = []
 
         # Populate the symbol selection combo box with available symbols
         self.populate_symbol_combo_box()
@@ -115,26 +257,51 @@ class SamplingLayerModule:
 
     def populate_symbol_combo_box(self):
         """
-        Loads symbol icons from specified directories into the symbol combo box.
-        Icons are expected to be in 'symbol_icon' and 'symbol_icon2' directories.
-        """
-        symbol_folder = os.path.join(os.path.dirname(__file__), "symbol_icon")
-        symbol_folder_editable = os.path.join(
-            os.path.dirname(__file__), "symbol_icon2"
+        Lists the available symbols in the symbol combo box.
+        Symbols are expected in the 'symbol_icon' and 'symbol_icon2' directories. Their SVG
+        icons are loaded on demand: the selected one right away, the rest when the list opens.
+        """
+        self.combo_box_symbol.setUpdatesEnabled(False)
+        # Read each symbol folder once instead of checking every SVG file separately
+        symbol_files = symbol_file_names(SYMBOL_DIR)
+        symbol_files_editable = symbol_file_names(SYMBOL_DIR_EDITABLE)
+        if symbol_files and symbol_files_editable:
+            for name, svg_path, svg_path_editable in SYMBOL_PATHS:
+                file_name = os.path.basename(svg_path)
+                if file_name in symbol_files and file_name in symbol_files_editable:
+                    # Add the symbol without its icon, which is loaded when first shown
+                    self.combo_box_symbol.addItem(
+                        QIcon(), name, (svg_path, svg_path_editable)
+                    )
+                    self.symbol_data_by_index.append((svg_path, svg_path_editable))
+        self.combo_box_symbol.setUpdatesEnabled(True)
+
+        self.combo_box_symbol.currentIndexChanged.connect(self.load_symbol_icon)
+        self.symbol_popup_filter = SymbolPopupFilter(
+            self.load_symbol_icons, self.combo_box_symbol
         )
-        if os.path.exists(symbol_folder) and os.path.exists(symbol_folder_editable):
-            for i in range(1, 11):
-                svg_path = os.path.join(symbol_folder, f"Symbol {i}.svg")
-                svg_path_editable = os.path.join(symbol_folder_editable, f"Symbol {i}.svg")
-                if os.path.exists(svg_path) and os.path.exists(svg_path_editable):
-                    try:
-                        # Create an icon from the SVG file and add it to the combo box
-                        icon = QIcon(svg_path)
-                        self.combo_box_symbol.addItem(
-                            icon, f"Symbol {i}", (svg_path, svg_path_editable)
-                        )
-                    except Exception as e:
-                        print(f"Error loading symbol {i}: {str(e)}")
+        self.combo_box_symbol.view().installEventFilter(self.symbol_popup_filter)
+        self.load_symbol_icon(self.combo_box_symbol.currentIndex())
+
+    def load_symbol_icon(self, index):
+        """
+        Loads the SVG icon of the symbol at the given index if it has not been loaded yet.
+        """
+        if index < 0 or not self.combo_box_symbol.itemIcon(index).isNull():
+            return
+        symbol_data = self.combo_box_symbol.itemData(index)
+        if symbol_data:
+            try:
+                self.combo_box_symbol.setItemIcon(index, cached_icon(symbol_data[0]))
+            except Exception as e:
+                print(f"Error loading symbol {index + 1}: {str(e)}")
+
+    def load_symbol_icons(self):
+        """
+        Loads the SVG icons of all symbols still shown without one.
+        """
+        for index in range(self.combo_box_symbol.count()):
+            self.load_symbol_icon(index)
 
     def save_symbol(self):
         """
@@ -142,40 +309,61 @@ class SamplingLayerModule:
         Returns True if a symbol is selected, False otherwise.
         """
         index = self.combo_box_symbol.currentIndex()
-        if index >= 0:
-            symbol_data = self.combo_box_symbol.itemData(index)
-            if symbol_data:
-                self.selected_symbol, self.selected_symbol_editable = symbol_data
-                return True
+        if 0 <= index < len(self.symbol_data_by_index):
+            self.selected_symbol, self.selected_symbol_editable = self.symbol_data_by_index[index]
+            return True
         return False
 
-    def populate_shapefile_layers(self):
+    def populate_shapefile_layers(self, highlight_layer_id=None):
         """
         Populates the shapefile layers combo box with available vector layers from the QGIS project.
         Only point, line, and polygon geometries are considered.
+        If highlight_layer_id is given, that layer becomes the current selection.
         """
-        self.combo_box.clear()
+        if not _GEOMETRY_ICONS:
+            _GEOMETRY_ICONS.update({
+                QgsWkbTypes.PointGeometry: cached_icon(":/images/themes/default/mIconPointLayer.svg"),
+                QgsWkbTypes.LineGeometry: cached_icon(":/images/themes/default/mIconLineLayer.svg"),
+                QgsWkbTypes.PolygonGeometry: cached_icon(":/images/themes/default/mIconPolygonLayer.svg"),
+                None: QIcon(),
+            })
+
         root = QgsProject.instance().layerTreeRoot()
         tree_layers = root.findLayers()
 
+        items = []
+        highlight_index = None
+        epsg_cache = {}
         for tree_layer in tree_layers:
             layer = tree_layer.layer()
             if isinstance(layer, QgsVectorLayer):
-                geom_type = layer.geometryType()
+                if layer.id() == highlight_layer_id:
+                    highlight_index = len(items)
                 # Select appropriate icon based on geometry type
-                if geom_type == QgsWkbTypes.PointGeometry:
-                    icon = QIcon(":/images/themes/default/mIconPointLayer.svg")
-                elif geom_type == QgsWkbTypes.LineGeometry:
-                    icon = QIcon(":/images/themes/default/mIconLineLayer.svg")
-                elif geom_type == QgsWkbTypes.PolygonGeometry:
-                    icon = QIcon(":/images/themes/default/mIconPolygonLayer.svg")
-                else:
-                    icon = QIcon()
-                # Get EPSG code for the layer's CRS
-                epsg_code = layer.crs().authid()
+                icon = _GEOMETRY_ICONS.get(layer.geometryType(), _GEOMETRY_ICONS[None])
+                # Get EPSG code for the layer's CRS, looked up once per CRS
+                crs = layer.crs()
+                srsid = crs.srsid()
+                epsg_code = epsg_cache.get(srsid)
+                if epsg_code is None:
+                    epsg_code = epsg_cache[srsid] = sys.intern(crs.authid())
                 display_name = f"{layer.name()} [{epsg_code}]"
-                # Add the layer to the combo box with its icon and name
-                self.combo_box.addItem(icon, display_name)
+                items.append((icon, display_name, layer.id()))
+
+        # Refill the combo box in one pass and notify listeners once with the final selection
+        self.combo_box.setUpdatesEnabled(False)
+        self.combo_box.blockSignals(True)
+        try:
+            self.combo_box.clear()
+            for icon, display_name, layer_id in items:
+                # Keep the layer id as item data so the layer can be found without a name search
+                self.combo_box.addItem(icon, display_name, layer_id)
+            if highlight_index is not None:
+                self.combo_box.setCurrentIndex(highlight_index)
+        finally:
+            self.combo_box.blockSignals(False)
+            self.combo_box.setUpdatesEnabled(True)
+        self.combo_box.currentIndexChanged.emit(self.combo_box.currentIndex())
 
     def open_file_dialog(self):
         """
@@ -191,11 +379,8 @@ class SamplingLayerModule:
             if layer.isValid():
                 # Add the layer to the current QGIS project
                 QgsProject.instance().addMapLayer(layer)
-                self.populate_shapefile_layers()
-                # Set the newly added layer as the current selection in the combo box
-                index = self.combo_box.findText(layer.name())
-                if index != -1:
-                    self.combo_box.setCurrentIndex(index)
+                # Refresh the combo box with the newly added layer as the current selection
+                self.populate_shapefile_layers(highlight_layer_id=layer.id())
             else:
                 # Show a warning if the shapefile is invalid
                 QMessageBox.warning(
@@ -211,24 +396,42 @@ class SamplingLayerModule:
             None, "Select Exclusion Files", "", "Shapefiles (*.shp);;All Files (*)"
         )
         if files:
+            valid_layers = []
+            invalid_files = []
+            # Exclusion layers are never drawn or styled, so skip the default style lookup
+            # and the CRS validation prompt when opening them
+            options = QgsVectorLayer.LayerOptions(QgsProject.instance().transformContext())
+            options.loadDefaultStyle = False
+            options.skipCrsValidation = True
             for file in files:
-                # Create a vector layer from each selected shapefile
-                layer = QgsVectorLayer(file, os.path.basename(file), "ogr")
+                # Create a vector layer from each selected shapefile on the GUI thread
+                layer = QgsVectorLayer(file, os.path.basename(file), "ogr", options)
                 if layer.isValid():
-                    # Add the layer to the project without adding it to the legend
-                    QgsProject.instance().addMapLayer(layer, addToLegend=False)
-                    # Create a list item for the exclusion layer
+                    valid_layers.append((file, layer))
+                else:
+                    invalid_files.append(file)
+
+            if valid_layers:
+                # Add all layers to the project at once, without adding them to the legend
+                QgsProject.instance().addMapLayers(
+                    [layer for _, layer in valid_layers], addToLegend=False
+                )
+                # Create a list item for each exclusion layer, repainting the list once
+                self.list_widget_exclusion.setUpdatesEnabled(False)
+                for file, layer in valid_layers:
                     list_item = QListWidgetItem(os.path.basename(file))
                     list_item.setData(Qt.UserRole, layer.id())
-                    # Add the item to the exclusion list widget
                     self.list_widget_exclusion.addItem(list_item)
-                else:
-                    # Show a warning if any shapefile is invalid
-                    QMessageBox.warning(
-                        None,
-                        "Invalid Layer",
-                        f"The file '{file}' is not a valid shapefile.",
-                    )
+                self.list_widget_exclusion.setUpdatesEnabled(True)
+
+            if invalid_files:
+                # Show a single warning listing every invalid shapefile
+                file_list = "\n".join(f"'{file}'" for file in invalid_files)
+                QMessageBox.warning(
+                    None,
+                    "Invalid Layer",
+                    f"The following files are not valid shapefiles:\n{file_list}",
+                )
 
     def remove_exclusion_layer(self, item):
         """
@@ -256,6 +459,67 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
     Initializes the UI, sets up connections between UI elements and functionalities,
     and manages the overall workflow of the sampling processes.
     """
+    # Scaled logo shared by every dialog instance, built when the first one is created
+    _LOGO_PIXMAP = None
+
+    # (checkbox name, dedicated handler name or None) for every function checkbox
+    _FUNCTION_CHECKBOX_SPECS = (
+        ("checkBoxaddsamplesmanually", "on_addsamplesmanually_changed"),
+        ("checkBoxaddsamplesbycoordinates", "on_addsamplesbycoordinates_changed"),
+        ("checkBoxaddsamplesbyfile", "on_addsamplesbyfile_changed"),
+        ("checkBoxaddsamplesrandomly", "on_addsamplesrandomly_changed"),
+        ("checkBoxaddsamplessystematically", None),
+        ("checkBoxaddstratifiedsamplesrandomly", None),
+        ("checkBoxaddstratifiedsamplessystematically", None),
+        ("checkBoxaddclustersamplesrandomly", None),
+        ("checkBoxaddclustersamplessystematically", None),
+        ("checkBoxshpsamplingarea", None),
+        ("checkBoxgenerateshpbycoordinates", None),
+        ("checkBoxstratapolyline", None),
+        ("checkBoxstratavoronoi", None),
+        ("checkBoxstratalines", None),
+    )
+
+    # Sampling methods started by _start_sampling: (module attribute, module label,
+    # {set_parameters keyword: spin box name} or None for modules that read the dialog themselves)
+    _SAMPLING_SPECS = {
+        "stratified": ("stratified_sampling", "Stratified random sampling", None),
+        "cluster": ("cluster_sampling", "Cluster random sampling", None),
+        "systematic": ("systematic_sampling", "Systematic sampling", {
+            "spacing_x": "doubleSpinBoxdistancexsamples",
+            "spacing_y": "doubleSpinBoxdistanceysamples",
+            "perimeter_buffer_sample_area": "doubleSpinBoxdistanceperimetersamplearea",
+            "perimeter_buffer_exclusion_area": "doubleSpinBoxdistanceperimeterexclusionarea",
+        }),
+        "stratified_systematic": ("stratified_systematic_sampling", "Stratified systematic sampling", {
+            "spacing_x": "doubleSpinBoxdistancestratifiedxsamples",
+            "spacing_y": "doubleSpinBoxdistancestratifiedysamples",
+            "perimeter_buffer_sample_area": "doubleSpinBoxdistancestratifiedperimeter",
+            "perimeter_buffer_exclusion_area": "doubleSpinBoxdistancestratifiedexclusion",
+        }),
+        "cluster_systematic": ("cluster_systematic_sampling", "Cluster systematic sampling", {
+            "spacing_x": "doubleSpinBoxdistanceclusterxsamples",
+            "spacing_y": "doubleSpinBoxdistanceclusterysamples",
+            "perimeter_buffer_sample_area": "doubleSpinBoxdistanceclusterperimeter",
+            "perimeter_buffer_exclusion_area": "doubleSpinBoxdistanceclusterexclusion",
+        }),
+    }
+
+    # Temporary layers removed when the dialog closes:
+    # (module attribute, layer attribute, whether to clear the module's reference afterwards)
+    _TEMP_LAYER_CLEANUP_SPECS = (
+        ("area_exclusion", "temp_sampling_layer", False),
+        ("area_exclusion", "temp_coordinates_layer", False),
+        ("judgmental_sampling", "temp_layer", True),
+    )
+
+    @cached_property
+    def reset_manager(self):
+        """
+        Reset manager, built the first time a reset, close or method change needs it.
+        """
+        return ResetFunction(self)
+
     def __init__(self, iface=None, parent=None):
         super(SamplingDialog, self).__init__(parent)
         self.setWindowFlags(self.windowFlags() | Qt.WindowMinimizeButtonHint)  # Add minimize button to the dialog window while keeping the close button
@@ -263,9 +527,93 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         self.tabWidget.setCurrentIndex(0)  # Set Judgmental tab as default when opening the plugin
         self.iface = iface  # Reference to the QGIS interface
 
-        # Initialize the reset manager and connect the reset button
-        self.reset_manager = ResetFunction(self)
-        self.pushbuttonreset.clicked.connect(self.reset_manager.full_plugin_reset)
+        # Control groups enabled and disabled together by the method checkboxes
+        self.controls_systematic = (
+            self.doubleSpinBoxdistancexsamples,
+            self.doubleSpinBoxdistanceysamples,
+            self.spinBoxanglesystematically,
+            self.pushButtonregularsystematicstart,
+            self.pushButtonregularsystematicsave,
+            self.doubleSpinBoxdistanceperimetersamplearea,
+            self.doubleSpinBoxdistanceperimeterexclusionarea,
+            self.checkBoxoutsidesampling_zigzagsystematic,
+            self.checkBoxoutsidesampling_systematic,
+        )
+        self.controls_manual = (
+            self.pushButtonedition,
+            self.pushButtonfinishedition,
+            self.checkBoxoutsidesampling,
+        )
+        self.controls_coordinates = (
+            self.pushButtonaddcoordinates_judgmental,
+            self.pushButtonfinishcoordinates_judgmental,
+            self.listWidgetlistofcoordinates_judgmental,
+            self.lineEditxcoordinates_judgmental,
+            self.lineEditycoordinate_judgmental,
+            self.checkBoxoutsidesampling,
+        )
+        self.controls_file = (
+            self.pushButtonloadfilejudgmental,
+            self.lineEditaddsamplesbyfile,
+            self.comboBoxcolumnx,
+            self.comboBoxcolumny,
+            self.pushButtonaddcoordinatesfile_judgmental,
+            self.pushButtonfinishcoordinatesfile_judgmental,
+            self.checkBoxoutsidesampling,
+        )
+        self.controls_stratified_systematic = (
+            self.doubleSpinBoxdistancestratifiedxsamples,
+            self.doubleSpinBoxdistancestratifiedysamples,
+            self.spinBoxanglestratifiedsystematically,
+            self.pushButtonstratifiedsystematicstart,
+            self.pushButtonstratifiedsystematicsave,
+            self.checkBoxstratifiedsampling_zigzagsystematic,
+            self.checkBoxoutsidesampling_stratified,
+            self.doubleSpinBoxdistancestratifiedperimeter,
+            self.doubleSpinBoxdistancestratifiedexclusion,
+        )
+        self.controls_cluster_random = (
+            self.spinBoxnumberofclustersamples,
+            self.doubleSpinBoxdistanceclustersamples,
+            self.pushButtonclusterrandomstart,
+            self.pushButtonclusterrandomreset,
+            self.pushButtonclusterrandomsave,
+            self.doubleSpinBoxdistanceclusterperimeter,
+            self.doubleSpinBoxdistanceclusterexclusion,
+            self.checkBoxoutsidesamplingcluster,
+            self.checkBoxadjustclustersamplesbysurfacearea,
+        )
+        self.controls_cluster_systematic = (
+            self.doubleSpinBoxdistanceclusterxsamples,
+            self.doubleSpinBoxdistanceclusterysamples,
+            self.spinBoxangleclustersystematically,
+            self.pushButtonclustersystematicstart,
+            self.pushButtonclustersystematicsave,
+            self.checkBoxclustersampling_zigzagcluster,
+            self.checkBoxoutsidesamplingcluster,
+            self.doubleSpinBoxdistanceclusterperimeter,
+            self.doubleSpinBoxdistanceclusterexclusion,
+        )
+        self.controls_random = (
+            self.spinBoxnumberofsamples,
+            self.doubleSpinBoxdistancesamples,
+            self.doubleSpinBoxdistanceexclusion,
+            self.doubleSpinBoxdistanceperimeter,
+            self.pushButtonrandomstart,
+            self.pushButtonrandomreset,
+            self.pushButtonrandomsave,
+            self.checkBoxoutsidesamplingrandom,
+        )
+
+        # Parameter spin boxes of each systematic method, resolved once: {kind: ((keyword, spin box), ...)}
+        self.sampling_parameter_widgets = {
+            kind: tuple((name, getattr(self, widget)) for name, widget in parameter_widgets.items())
+            for kind, (_, _, parameter_widgets) in self._SAMPLING_SPECS.items()
+            if parameter_widgets is not None
+        }
+
+        # Connect the reset button; the reset manager is created on first use
+        self.pushbuttonreset.clicked.connect(lambda: self.reset_manager.full_plugin_reset())
 
         # Initialize module attributes to None to ensure they exist from the start
         self.area_exclusion = None
@@ -277,6 +625,9 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         self.stratified_systematic_sampling = None
         self.cluster_systematic_sampling = None
         self.stratified_shapefile = None
+        self.initially_disabled_controls = None
+        self.exclusion_layers_cache = None
+        self.about_dialog = None
 
         # Initialize the SamplingLayerModule with relevant UI components
         self.layer_module = SamplingLayerModule(
@@ -316,27 +667,39 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         )
 
         # Load and display the plugin's logo
-        plugin_dir = os.path.dirname(__file__)
-        icon_path = os.path.join(plugin_dir, "icon_ui.png")
-        pixmap = QPixmap(icon_path)
-
         self.label_logo.setScaledContents(True)
         self.label_logo.setAttribute(Qt.WA_TranslucentBackground)
         self.label_logo.setWindowFlags(Qt.FramelessWindowHint)
 
-        # Scale the logo image for better visibility
-        scale_factor = 2
-        scaled_width = int(self.label_logo.width() * scale_factor)
-        scaled_height = int(self.label_logo.height() * scale_factor)
-
-        scaled_pixmap = pixmap.scaled(
-            scaled_width,
-            scaled_height,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        # Scale the logo image for better visibility, only for the first dialog created
+        if SamplingDialog._LOGO_PIXMAP is None:
+            icon_path = os.path.join(PLUGIN_DIR, "icon_ui.png")
+            pixmap = QPixmap(icon_path)
+
+            scale_factor = 2
+            scaled_width = int(self.label_logo.width() * scale_factor)
+            scaled_height = int(self.label_logo.height() * scale_factor)
+
+            # Resample only when the image is larger than needed; the label scales smaller ones
+            if pixmap.width() > scaled_width or pixmap.height() > scaled_height:
+                # Cut a much larger image down to a few times the target without filtering first,
+                # so the smooth pass below only filters a small image
+                if pixmap.width() > scaled_width * 4 or pixmap.height() > scaled_height * 4:
+                    pixmap = pixmap.scaled(
+                        scaled_width * 4,
+                        scaled_height * 4,
+                        Qt.KeepAspectRatio,
+                        Qt.FastTransformation
+                    )
+                pixmap = pixmap.scaled(
+                    scaled_width,
+                    scaled_height,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+            SamplingDialog._LOGO_PIXMAP = pixmap
 
-        self.label_logo.setPixmap(scaled_pixmap)
+        self.label_logo.setPixmap(SamplingDialog._LOGO_PIXMAP)
 
     def keyPressEvent(self, event):
         """Override keyPressEvent to prevent Enter key from opening symbol folder"""
@@ -363,6 +726,13 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         self.pushButtonexclusion.clicked.connect(
             self.layer_module.open_exclusion_file_dialog
         )
+        # Re-resolve the exclusion layers whenever the list or the project's layers change
+        exclusion_model = self.listWidgetexclusion.model()
+        exclusion_model.rowsInserted.connect(self._invalidate_exclusion_layers)
+        exclusion_model.rowsRemoved.connect(self._invalidate_exclusion_layers)
+        exclusion_model.dataChanged.connect(self._invalidate_exclusion_layers)
+        exclusion_model.modelReset.connect(self._invalidate_exclusion_layers)
+        QgsProject.instance().layersRemoved.connect(self._invalidate_exclusion_layers)
         # Connect double-click on exclusion list items to removal handler
         self.listWidgetexclusion.itemDoubleClicked.connect(
             self.layer_module.remove_exclusion_layer
@@ -372,72 +742,39 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
             self.pushbuttonsymbol.clicked.connect(self.open_symbol_folder)
 
         # Connect the close button to the plugin's close handler
-        self.pushbuttonclose.clicked.connect(self.reset_manager.close_plugin)
-
-        # List of all function-related checkboxes to connect to a common handler
-        self.all_function_checkboxes = [
-            self.checkBoxaddsamplesmanually,
-            self.checkBoxaddsamplesbycoordinates,
-            self.checkBoxaddsamplesbyfile,
-            self.checkBoxaddsamplesrandomly,
-            self.checkBoxaddsamplessystematically,
-            self.checkBoxaddstratifiedsamplesrandomly,
-            self.checkBoxaddstratifiedsamplessystematically,
-            self.checkBoxaddclustersamplesrandomly,
-            self.checkBoxaddclustersamplessystematically,
-            self.checkBoxshpsamplingarea,
-            self.checkBoxgenerateshpbycoordinates,
-            self.checkBoxstratapolyline,
-            self.checkBoxstratavoronoi,
-            self.checkBoxstratalines
-        ]
-
-        # Connect each checkbox to the general function checkbox state handler
+        self.pushbuttonclose.clicked.connect(lambda: self.reset_manager.close_plugin())
+
+        # All function-related checkboxes, and the dedicated handlers that run after the
+        # general handler, keyed by checkbox object name
+        self.all_function_checkboxes = tuple(
+            getattr(self, name) for name, _ in self._FUNCTION_CHECKBOX_SPECS
+        )
+        self.function_checkbox_handlers = {
+            name: getattr(self, handler_name)
+            for name, handler_name in self._FUNCTION_CHECKBOX_SPECS if handler_name
+        }
+
+        # Route every function checkbox to a single dispatcher, bound to the checkbox name
         for cb in self.all_function_checkboxes:
-            cb.stateChanged.connect(self.on_function_checkbox_changed)
+            cb.stateChanged.connect(partial(self._dispatch_function_checkbox, cb.objectName()))
 
         # Centralized connection for the Validate ID button (Cluster)
         self.pushbuttonvalidateclusterid.clicked.connect(self._on_cluster_validate_clicked)
 
-        # Connect specific checkboxes to their dedicated handlers
-        self.checkBoxaddsamplesmanually.stateChanged.connect(
-            self.on_addsamplesmanually_changed
-        )
-        self.checkBoxaddsamplesbycoordinates.stateChanged.connect(
-            self.on_addsamplesbycoordinates_changed
-        )
-        self.checkBoxaddsamplesbyfile.stateChanged.connect(
-            self.on_addsamplesbyfile_changed
-        )
-        self.checkBoxaddsamplesrandomly.stateChanged.connect(
-            self.on_addsamplesrandomly_changed
-        )
-
         # Connect the change of the selected layer in the combo box to update all modules
         self.comboBoxshpsampling.currentIndexChanged.connect(self._update_sampling_modules_layer)
 
         # Initialize and connect random sampling module
         # Note: self.random_sampling is initialized to None at the start of __init__
         self.random_sampling = RandomSampling(self.iface, self)
-        self.spinBoxnumberofsamples.valueChanged.connect(self.update_random_parameters)
-        self.doubleSpinBoxdistanceperimeter.valueChanged.connect(self.update_random_parameters)
-        self.doubleSpinBoxdistancesamples.valueChanged.connect(self.update_random_parameters)
-        self.doubleSpinBoxdistanceexclusion.valueChanged.connect(self.update_random_parameters)
         self.pushButtonrandomstart.clicked.connect(self.random_sampling.on_pushButtonrandomstart_clicked)
         self.pushButtonrandomreset.clicked.connect(self.random_sampling.on_pushButtonrandomreset_clicked)
         self.pushButtonrandomsave.clicked.connect(self.random_sampling.on_pushButtonrandomsave_clicked)
-        self.checkBoxoutsidesamplingrandom.stateChanged.connect(self.update_random_parameters)
 
         # Initialize and connect stratified random sampling module
         # Note: self.stratified_sampling is initialized to None at the start of __init__
         self.stratified_sampling = StratifiedRandomSampling(self.iface, self)
-        self.spinBoxnumberofstratifiedsamples.valueChanged.connect(self.update_stratified_parameters)
-        self.doubleSpinBoxdistancestratifiedsamples.valueChanged.connect(self.update_stratified_parameters)
-        self.doubleSpinBoxdistancestratifiedperimeter.valueChanged.connect(self.update_stratified_parameters)
-        self.doubleSpinBoxdistancestratifiedexclusion.valueChanged.connect(self.update_stratified_parameters)
-        self.checkBoxadjustsamplesbysurfacearea.stateChanged.connect(self.update_stratified_parameters)
         self.pushButtonstratifiedrandomstart.clicked.connect(self.start_stratified_sampling)
-        self.checkBoxoutsidesampling_stratified.stateChanged.connect(self.update_stratified_parameters)
         self.checkBoxaddstratifiedsamplesrandomly.stateChanged.connect(
             self.stratified_sampling.on_checkBoxaddstratifiedsamplesrandomly_stateChanged
         )
@@ -445,13 +782,7 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         # Initialize and connect cluster random sampling module
         # Note: self.cluster_sampling is initialized to None at the start of __init__
         self.cluster_sampling = ClusterRandomSampling(self.iface, self)
-        self.spinBoxnumberofclustersamples.valueChanged.connect(self.update_cluster_parameters)
-        self.doubleSpinBoxdistanceclustersamples.valueChanged.connect(self.update_cluster_parameters)
-        self.doubleSpinBoxdistanceclusterperimeter.valueChanged.connect(self.update_cluster_parameters)
-        self.doubleSpinBoxdistanceclusterexclusion.valueChanged.connect(self.update_cluster_parameters)
-        self.checkBoxadjustclustersamplesbysurfacearea.stateChanged.connect(self.update_cluster_parameters)
         self.pushButtonclusterrandomstart.clicked.connect(self.start_cluster_sampling)
-        self.checkBoxoutsidesamplingcluster.stateChanged.connect(self.update_cluster_parameters)
         self.checkBoxaddclustersamplesrandomly.stateChanged.connect(
             self.cluster_sampling.on_checkBoxaddclustersamplesrandomly_stateChanged
         )
@@ -459,11 +790,15 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         # Initialize and connect stratified systematic sampling module
         # Note: self.stratified_systematic_sampling is initialized to None at the start of __init__
         self.stratified_systematic_sampling = StratifiedSystematicSampling(self.iface, self)
+        # Checking one stratified method unchecks the other; the systematic one also toggles its controls
         self.checkBoxaddstratifiedsamplessystematically.stateChanged.connect(
-            self.on_addstratifiedsystematic_changed
+            partial(self._uncheck_if, self.checkBoxaddstratifiedsamplesrandomly)
+        )
+        self.checkBoxaddstratifiedsamplessystematically.stateChanged.connect(
+            partial(self._set_group_enabled, self.controls_stratified_systematic)
         )
         self.checkBoxaddstratifiedsamplesrandomly.stateChanged.connect(
-            self.on_addstratifiedrandom_changed
+            partial(self._uncheck_if, self.checkBoxaddstratifiedsamplessystematically)
         )
         self.pushButtonstratifiedsystematicstart.clicked.connect(
             self.start_stratified_systematic_sampling
@@ -475,11 +810,15 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         # Initialize and connect cluster systematic sampling module
         # Note: self.cluster_systematic_sampling is initialized to None at the start of __init__
         self.cluster_systematic_sampling = ClusterSystematicSampling(self.iface, self)
+        # Checking cluster systematic unchecks cluster random; each toggles its own controls
+        self.checkBoxaddclustersamplessystematically.stateChanged.connect(
+            partial(self._uncheck_if, self.checkBoxaddclustersamplesrandomly)
+        )
         self.checkBoxaddclustersamplessystematically.stateChanged.connect(
-            self.on_addclustersystematic_changed
+            partial(self._set_group_enabled, self.controls_cluster_systematic)
         )
         self.checkBoxaddclustersamplesrandomly.stateChanged.connect(
-            self.on_addclusterrandom_changed
+            partial(self._set_group_enabled, self.controls_cluster_random)
         )
         self.pushButtonclustersystematicstart.clicked.connect(
             self.start_cluster_systematic_sampling
@@ -500,6 +839,15 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         if hasattr(self, 'pushButtonlicense'):
             self.pushButtonlicense.clicked.connect(self.open_license_file)
 
+    def _resolve_sampling_layer(self):
+        """
+        Returns the layer selected in comboBoxshpsampling, or None if there is none.
+        """
+        layer_id = self.comboBoxshpsampling.currentData()
+        if not layer_id:
+            return None
+        return QgsProject.instance().mapLayer(layer_id)
+
     def _update_sampling_modules_layer(self, index):
         """
         Finds the layer selected in comboBoxshpsampling and passes it to all
@@ -518,20 +866,11 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
             self.lineEditEPSGcode.clear()
             return
 
-        # Get the name of the selected layer (without the EPSG code if present)
-        layer_display_name = self.comboBoxshpsampling.currentText()
-        layer_name = layer_display_name.split(" [")[0]
-
-        sampling_layer = None
-        # Find the actual layer object in the QGIS project by its name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == layer_name:
-                sampling_layer = layer
-                break
+        # Find the actual layer object in the QGIS project from the id stored on the item
+        sampling_layer = self._resolve_sampling_layer()
 
         # If the layer was found, pass it to the module instances
         if sampling_layer:
-            print(f"Layer selected in combobox: {sampling_layer.name()}")
             # Ensure modules exist before calling their method
             if self.random_sampling:
                 self.random_sampling.set_sampling_area(sampling_layer)
@@ -567,7 +906,11 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
                  self.lineEditEPSGcode.clear()
 
         else:
-            print(f"Layer not found for selected name: {layer_name}")
+            QgsMessageLog.logMessage(
+                f"Sampling layer not found for '{self.comboBoxshpsampling.currentText()}' "
+                f"(id {self.comboBoxshpsampling.currentData()})",
+                'Sampling Time', level=Qgis.Warning
+            )
             # Clear references if the layer is not found (e.g., if it was removed)
             if self.random_sampling: self.random_sampling.set_sampling_area(None)
             if self.systematic_sampling: self.systematic_sampling.set_sampling_area(None)
@@ -597,16 +940,13 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         Shows a warning if the folder does not exist or an error occurs.
         """
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            symbol_dir = os.path.join(current_dir, "symbol_icon2")
-
-            if os.path.exists(symbol_dir):
-                webbrowser.open(symbol_dir)
+            if os.path.exists(SYMBOL_DIR_EDITABLE):
+                webbrowser.open(SYMBOL_DIR_EDITABLE)
             else:
                 QMessageBox.warning(
                     self,
                     "Error",
-                    f"Symbol directory not found at: {symbol_dir}"
+                    f"Symbol directory not found at: {SYMBOL_DIR_EDITABLE}"
                 )
         except Exception as e:
             QMessageBox.warning(
@@ -620,59 +960,16 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         Disables specific UI controls at startup to prevent user interaction
         until certain conditions are met.
         """
-        controls_to_disable = [
-            self.pushButtonedition,
-            self.pushButtonfinishedition,
-            self.checkBoxoutsidesampling,
-            self.pushButtonaddcoordinates_judgmental,
-            self.pushButtonfinishcoordinates_judgmental,
-            self.listWidgetlistofcoordinates_judgmental,
-            self.lineEditxcoordinates_judgmental,
-            self.lineEditycoordinate_judgmental,
-            self.pushButtonloadfilejudgmental,
-            self.lineEditaddsamplesbyfile,
-            self.comboBoxcolumnx,
-            self.comboBoxcolumny,
-            self.pushButtonaddcoordinatesfile_judgmental,
-            self.pushButtonfinishcoordinatesfile_judgmental,
-            self.spinBoxanglesystematically,
-            self.pushButtonregularsystematicstart,
-            self.pushButtonregularsystematicsave,
-            self.doubleSpinBoxdistancexsamples,
-            self.doubleSpinBoxdistanceysamples,
-            self.doubleSpinBoxdistanceperimetersamplearea,
-            self.doubleSpinBoxdistanceperimeterexclusionarea,
-            self.checkBoxoutsidesampling_zigzagsystematic,
-            self.checkBoxoutsidesampling_systematic,
-            self.spinBoxnumberofstratifiedsamples,
-            self.doubleSpinBoxdistancestratifiedsamples,
-            self.pushButtonstratifiedrandomstart,
-            self.pushButtonstratifiedrandomreset,
-            self.pushButtonstratifiedrandomsave,
-            self.doubleSpinBoxdistancestratifiedperimeter,
-            self.doubleSpinBoxdistancestratifiedexclusion,
-            self.checkBoxoutsidesampling_stratified,
-            self.checkBoxadjustsamplesbysurfacearea,
-            self.spinBoxnumberofclustersamples,
-            self.doubleSpinBoxdistanceclustersamples,
-            self.pushButtonclusterrandomstart,
-            self.pushButtonclusterrandomreset,
-            self.pushButtonclusterrandomsave,
-            self.doubleSpinBoxdistanceclusterperimeter,
-            self.doubleSpinBoxdistanceclusterexclusion,
-            self.checkBoxoutsidesamplingcluster,
-            self.checkBoxadjustclustersamplesbysurfacearea,
-            self.doubleSpinBoxdistanceclusterxsamples,
-            self.doubleSpinBoxdistanceclusterysamples,
-            self.spinBoxangleclustersystematically,
-            self.pushButtonclustersystematicstart,
-            self.pushButtonclustersystematicsave,
-            self.checkBoxclustersampling_zigzagcluster,
-            self.pushbuttonvalidateclusterid
-        ]
+        # The controls are tagged with the initiallyDisabled property in the .ui file;
+        # they are looked up once and the list is reused on every reset
+        if self.initially_disabled_controls is None:
+            self.initially_disabled_controls = [
+                widget for widget in self.findChildren(QtWidgets.QWidget)
+                if widget.property("initiallyDisabled")
+            ]
 
-        # Disable each control in the list
-        for control in controls_to_disable:
+        # Disable each tagged control
+        for control in self.initially_disabled_controls:
             control.setEnabled(False)
 
     def setup_modules(self):
@@ -731,12 +1028,25 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
     def setup_stratified_shapefile(self):
         """
         Initializes the Stratifiedshapefile module if the QGIS interface is available.
+        The module (and the processing framework it imports) is only loaded once the tab
+        holding the strata controls is first shown.
         """
         if self.iface:
-            self.stratified_shapefile = Stratifiedshapefile(self.iface, self)
+            self.tabWidget.currentChanged.connect(self._create_stratified_shapefile)
+            self._create_stratified_shapefile(self.tabWidget.currentIndex())
         else:
             self.stratified_shapefile = None
 
+    def _create_stratified_shapefile(self, index):
+        """
+        Creates the Stratifiedshapefile module when the tab at the given index holds its controls.
+        """
+        tab = self.tabWidget.widget(index)
+        if self.stratified_shapefile is None and tab and tab.isAncestorOf(self.checkBoxstratalines):
+            from .generate_shapefile import Stratifiedshapefile
+            self.stratified_shapefile = Stratifiedshapefile(self.iface, self)
+            self.tabWidget.currentChanged.disconnect(self._create_stratified_shapefile)
+
     def save_label_and_show_message(self):
         """
         Saves the sample label and shows an information message if successful.
@@ -773,152 +1083,86 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
                 "Please select a symbol before saving."
             )
 
-    def update_random_parameters(self):
+    def _start_sampling(self, kind):
         """
-        Placeholder method to handle updates to random sampling parameters.
-        Can be expanded to implement specific behaviors when parameters change.
+        Starts the sampling method named by kind (a key of _SAMPLING_SPECS).
+        Validates the selected sampling layer, collects the exclusion layers and passes both,
+        with the method's parameters, to its module.
         """
-        pass
+        module_attr, module_label, _ = self._SAMPLING_SPECS[kind]
+        parameter_widgets = self.sampling_parameter_widgets.get(kind)
+
+        sampling_layer = self._resolve_sampling_layer()
+        if not sampling_layer:
+            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
+            return
+
+        # Collect all exclusion layers selected by the user
+        exclusion_layers = self._collect_exclusion_layers()
+
+        module = getattr(self, module_attr)
+        if not module:
+            QMessageBox.warning(self, "Initialization Error", f"{module_label} module is not initialized.")
+            return
+
+        # Configure the sampling module with selected layers and parameters
+        module.set_sampling_area(sampling_layer)
+        module.set_exclusion_zones(exclusion_layers)
+        if parameter_widgets is None:
+            # The random modules read their parameters from the dialog and start from there
+            module.set_parameters()
+        else:
+            module.set_parameters(
+                label_root=self.layer_module.sample_label_root,
+                **{name: widget.value() for name, widget in parameter_widgets}
+            )
+            module.start_sampling()
 
-    def update_stratified_parameters(self):
+    def _collect_exclusion_layers(self):
         """
-        Placeholder method to handle updates to stratified sampling parameters.
-        Can be expanded to implement specific behaviors when parameters change.
+        Returns the project layers listed in the exclusion list widget.
+        The list is resolved once and reused until the exclusion list or the project layers change.
         """
-        pass
+        if self.exclusion_layers_cache is None:
+            list_item = self.listWidgetexclusion.item
+            map_layer = QgsProject.instance().mapLayer
+            layers = (
+                map_layer(list_item(i).data(Qt.UserRole))
+                for i in range(self.listWidgetexclusion.count())
+            )
+            self.exclusion_layers_cache = [layer for layer in layers if layer]
+        return list(self.exclusion_layers_cache)
 
-    def update_cluster_parameters(self):
+    def _invalidate_exclusion_layers(self, *args):
         """
-        Placeholder method to handle updates to cluster sampling parameters.
-        Can be expanded to implement specific behaviors when parameters change.
+        Drops the resolved exclusion layers so the next start resolves them again.
         """
-        pass
+        self.exclusion_layers_cache = None
 
     def start_stratified_sampling(self):
         """
         Initiates stratified random sampling based on the current settings and selected layers.
-        Validates the selected sampling layer and exclusion layers before starting the sampling process.
         """
-        # Get the name of the currently selected sampling layer
-        current_layer_name = self.comboBoxshpsampling.currentText().split(" [")[0]
-        sampling_layer = None
-
-        # Find the layer in the project by name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == current_layer_name:
-                sampling_layer = layer
-                break
-
-        if not sampling_layer:
-            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
-            return
-
-        # Collect all exclusion layers selected by the user
-        exclusion_layers = []
-        for i in range(self.listWidgetexclusion.count()):
-            item = self.listWidgetexclusion.item(i)
-            layer_id = item.data(Qt.UserRole)
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                exclusion_layers.append(layer)
-
-        # Configure the stratified sampling module with selected layers and parameters
-        if self.stratified_sampling:
-            self.stratified_sampling.set_sampling_area(sampling_layer)
-            self.stratified_sampling.set_exclusion_zones(exclusion_layers)
-            self.stratified_sampling.set_parameters()
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Stratified random sampling module is not initialized.")
-
+        self._start_sampling("stratified")
 
     def start_cluster_sampling(self):
         """
         Initiates cluster random sampling based on the current settings and selected layers.
-        Validates the selected sampling layer and exclusion layers before starting the sampling process.
         """
-        # Get the name of the currently selected sampling layer
-        current_layer_name = self.comboBoxshpsampling.currentText().split(" [")[0]
-        sampling_layer = None
-
-        # Find the layer in the project by name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == current_layer_name:
-                sampling_layer = layer
-                break
-
-        if not sampling_layer:
-            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
-            return
-
-        # Collect all exclusion layers selected by the user
-        exclusion_layers = []
-        for i in range(self.listWidgetexclusion.count()):
-            item = self.listWidgetexclusion.item(i)
-            layer_id = item.data(Qt.UserRole)
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                exclusion_layers.append(layer)
-
-        # Configure the cluster sampling module with selected layers and parameters
-        if self.cluster_sampling:
-            self.cluster_sampling.set_sampling_area(sampling_layer)
-            self.cluster_sampling.set_exclusion_zones(exclusion_layers)
-            self.cluster_sampling.set_parameters()
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Cluster random sampling module is not initialized.")
-
+        self._start_sampling("cluster")
 
     def start_systematic_sampling(self):
         """
         Initiates systematic sampling based on the current settings and selected layers.
-        Validates the selected sampling layer and exclusion layers before starting the sampling process.
         """
-        # Get the name of the currently selected sampling layer
-        current_layer_name = self.comboBoxshpsampling.currentText().split(" [")[0]
-        sampling_layer = None
-
-        # Find the layer in the project by name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == current_layer_name:
-                sampling_layer = layer
-                break
-
-        if not sampling_layer:
-            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
-            return
-
-        # Collect all exclusion layers selected by the user
-        exclusion_layers = []
-        for i in range(self.listWidgetexclusion.count()):
-            item = self.listWidgetexclusion.item(i)
-            layer_id = item.data(Qt.UserRole)
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                exclusion_layers.append(layer)
-
-        # Configure the systematic sampling module with selected layers and parameters
-        if self.systematic_sampling:
-            self.systematic_sampling.set_sampling_area(sampling_layer)
-            self.systematic_sampling.set_exclusion_zones(exclusion_layers)
-            self.systematic_sampling.set_parameters(
-                spacing_x=self.doubleSpinBoxdistancexsamples.value(),
-                spacing_y=self.doubleSpinBoxdistanceysamples.value(),
-                label_root=self.layer_module.sample_label_root,
-                perimeter_buffer_sample_area=self.doubleSpinBoxdistanceperimetersamplearea.value(),
-                perimeter_buffer_exclusion_area=self.doubleSpinBoxdistanceperimeterexclusionarea.value()
-            )
-            # Start the systematic sampling process
-            self.systematic_sampling.start_sampling()
-        else:
-            QMessageBox.warning(self, "Initialization Error", "Systematic sampling module is not initialized.")
-
+        self._start_sampling("systematic")
 
-    def save_systematic_sampling(self):
+    def _save_samples(self, module, default_name):
         """
-        Saves the results of the systematic sampling to a shapefile.
+        Saves the samples of the given sampling module to a shapefile.
         Prompts the user to select an output directory and enter a file name.
         """
-        if not hasattr(self.systematic_sampling, 'samples') or not self.systematic_sampling.samples:
+        if not getattr(module, 'samples', None):
             QMessageBox.warning(self, "Error", "No samples to save.")
             return
 
@@ -933,236 +1177,108 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
             "File name",
             "Enter file name (without extension):",
             QLineEdit.Normal,
-            "systematic_samples"
+            default_name
         )
         if not ok or not filename:
             return
-        if self.systematic_sampling:
-            # Save the samples using the systematic sampling module
-            self.systematic_sampling.save_samples(output_dir, filename)
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Systematic sampling module is not initialized.")
+        module.save_samples(output_dir, filename)
+
+    def save_systematic_sampling(self):
+        """
+        Saves the results of the systematic sampling to a shapefile.
+        """
+        self._save_samples(self.systematic_sampling, "systematic_samples")
 
     def save_stratified_systematic_sampling(self):
         """
         Saves the results of the stratified systematic sampling to a shapefile.
-        Prompts the user to select an output directory and enter a file name.
         """
-        if not hasattr(self.stratified_systematic_sampling, 'samples') or not self.stratified_systematic_sampling.samples:
-            QMessageBox.warning(self, "Error", "No samples to save.")
-            return
-
-        # Prompt the user to select an output directory
-        output_dir = QFileDialog.getExistingDirectory(self, "Select output directory")
-        if not output_dir:
-            return
-
-        # Prompt the user to enter a file name
-        filename, ok = QInputDialog.getText(
-            self,
-            "File name",
-            "Enter file name (without extension):",
-            QLineEdit.Normal,
-            "stratified_systematic_samples"
-        )
-        if not ok or not filename:
-            return
-        if self.stratified_systematic_sampling:
-            # Save the samples using the stratified systematic sampling module
-            self.stratified_systematic_sampling.save_samples(output_dir, filename)
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Stratified systematic sampling module is not initialized.")
+        self._save_samples(self.stratified_systematic_sampling, "stratified_systematic_samples")
 
     def save_cluster_systematic_sampling(self):
         """
         Saves the results of the cluster systematic sampling to a shapefile.
-        Prompts the user to select an output directory and enter a file name.
         """
-        if not hasattr(self.cluster_systematic_sampling, 'samples') or not self.cluster_systematic_sampling.samples:
-            QMessageBox.warning(self, "Error", "No samples to save.")
-            return
-
-        # Prompt the user to select an output directory
-        output_dir = QFileDialog.getExistingDirectory(self, "Select output directory")
-        if not output_dir:
-            return
-
-        # Prompt the user to enter a file name
-        filename, ok = QInputDialog.getText(
-            self,
-            "File name",
-            "Enter file name (without extension):",
-            QLineEdit.Normal,
-            "cluster_systematic_samples"
-        )
-        if not ok or not filename:
-            return
-        if self.cluster_systematic_sampling:
-            # Save the samples using the cluster systematic sampling module
-            self.cluster_systematic_sampling.save_samples(output_dir, filename)
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Cluster systematic sampling module is not initialized.")
+        self._save_samples(self.cluster_systematic_sampling, "cluster_systematic_samples")
 
     def start_stratified_systematic_sampling(self):
         """
         Initiates stratified systematic sampling based on the current settings and selected layers.
-        Validates the selected sampling layer and exclusion layers before starting the sampling process.
         """
-        # Get the name of the currently selected sampling layer
-        current_layer_name = self.comboBoxshpsampling.currentText().split(" [")[0]
-        sampling_layer = None
-
-        # Find the layer in the project by name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == current_layer_name:
-                sampling_layer = layer
-                break
-
-        if not sampling_layer:
-            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
-            return
-
-        # Collect all exclusion layers selected by the user
-        exclusion_layers = []
-        for i in range(self.listWidgetexclusion.count()):
-            item = self.listWidgetexclusion.item(i)
-            layer_id = item.data(Qt.UserRole)
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                exclusion_layers.append(layer)
-
-        # Configure the stratified systematic sampling module with selected layers and parameters
-        if self.stratified_systematic_sampling:
-            self.stratified_systematic_sampling.set_sampling_area(sampling_layer)
-            self.stratified_systematic_sampling.set_exclusion_zones(exclusion_layers)
-            self.stratified_systematic_sampling.set_parameters(
-                spacing_x=self.doubleSpinBoxdistancestratifiedxsamples.value(),
-                spacing_y=self.doubleSpinBoxdistancestratifiedysamples.value(),
-                label_root=self.layer_module.sample_label_root,
-                perimeter_buffer_sample_area=self.doubleSpinBoxdistancestratifiedperimeter.value(),
-                perimeter_buffer_exclusion_area=self.doubleSpinBoxdistancestratifiedexclusion.value()
-            )
-            # Start the stratified systematic sampling process
-            self.stratified_systematic_sampling.start_sampling()
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Stratified systematic sampling module is not initialized.")
+        self._start_sampling("stratified_systematic")
 
     def start_cluster_systematic_sampling(self):
         """
         Initiates cluster systematic sampling based on the current settings and selected layers.
-        Validates the selected sampling layer and exclusion layers before starting the sampling process.
         """
-        # Get the name of the currently selected sampling layer
-        current_layer_name = self.comboBoxshpsampling.currentText().split(" [")[0]
-        sampling_layer = None
-
-        # Find the layer in the project by name
-        for layer in QgsProject.instance().mapLayers().values():
-            if layer.name() == current_layer_name:
-                sampling_layer = layer
-                break
+        self._start_sampling("cluster_systematic")
 
-        if not sampling_layer:
-            QMessageBox.warning(self, "Error", "Please select a valid sampling layer.")
-            return
+    def _batch_enable(self, controls, enabled):
+        """
+        Enables or disables a group of controls with dialog repaints suspended,
+        so the dialog is repainted once for the whole group.
+        """
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for control in controls:
+                control.setEnabled(enabled)
+        finally:
+            # Nested calls leave re-enabling to the outermost one
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
 
-        # Collect all exclusion layers selected by the user
-        exclusion_layers = []
-        for i in range(self.listWidgetexclusion.count()):
-            item = self.listWidgetexclusion.item(i)
-            layer_id = item.data(Qt.UserRole)
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer:
-                exclusion_layers.append(layer)
-
-        # Configure the cluster systematic sampling module with selected layers and parameters
-        if self.cluster_systematic_sampling:
-            self.cluster_systematic_sampling.set_sampling_area(sampling_layer)
-            self.cluster_systematic_sampling.set_exclusion_zones(exclusion_layers)
-            self.cluster_systematic_sampling.set_parameters(
-                spacing_x=self.doubleSpinBoxdistanceclusterxsamples.value(),
-                spacing_y=self.doubleSpinBoxdistanceclusterysamples.value(),
-                label_root=self.layer_module.sample_label_root,
-                perimeter_buffer_sample_area=self.doubleSpinBoxdistanceclusterperimeter.value(),
-                perimeter_buffer_exclusion_area=self.doubleSpinBoxdistanceclusterexclusion.value()
-            )
-            # Start the cluster systematic sampling process
-            self.cluster_systematic_sampling.start_sampling()
-        else:
-             QMessageBox.warning(self, "Initialization Error", "Cluster systematic sampling module is not initialized.")
+    def _set_group_enabled(self, controls, state):
+        """
+        Enables a group of controls when the checkbox state is checked and disables it otherwise.
+        """
+        self._batch_enable(controls, state == Qt.Checked)
 
+    def _uncheck_if(self, checkbox, state):
+        """
+        Unchecks the given conflicting checkbox when the checkbox state is checked.
+        """
+        if state == Qt.Checked:
+            checkbox.setChecked(False)
 
     def on_checkBoxaddsamplessystematically_stateChanged(self, state):
         """
         Handles the state change of the 'Add Samples Systematically' checkbox.
         Enables or disables related controls based on whether the checkbox is checked.
         """
-        controls = [
-            self.doubleSpinBoxdistancexsamples,
-            self.doubleSpinBoxdistanceysamples,
-            self.spinBoxanglesystematically,
-            self.pushButtonregularsystematicstart,
-            self.pushButtonregularsystematicsave,
-            self.doubleSpinBoxdistanceperimetersamplearea,
-            self.doubleSpinBoxdistanceperimeterexclusionarea,
-            self.checkBoxoutsidesampling_zigzagsystematic,
-            self.checkBoxoutsidesampling_systematic,
-        ]
-        for control in controls:
-            control.setEnabled(state == Qt.Checked)
+        enabled = state == Qt.Checked
+        self._batch_enable(self.controls_systematic, enabled)
 
     def on_addsamplesmanually_changed(self, state):
         """
         Handles the state change of the 'Add Samples Manually' checkbox.
         Enables or disables related controls based on whether the checkbox is checked.
         """
-        controls_manual = [
-            self.pushButtonedition,
-            self.pushButtonfinishedition,
-            self.checkBoxoutsidesampling,
-        ]
-        for control in controls_manual:
-            control.setEnabled(state == Qt.Checked)
+        enabled = state == Qt.Checked
+        self._batch_enable(self.controls_manual, enabled)
 
     def on_addsamplesbycoordinates_changed(self, state):
         """
         Handles the state change of the 'Add Samples by Coordinates' checkbox.
         Enables or disables related controls based on whether the checkbox is checked.
         """
-        controls_coordinates = [
-            self.pushButtonaddcoordinates_judgmental,
-            self.pushButtonfinishcoordinates_judgmental,
-            self.listWidgetlistofcoordinates_judgmental,
-            self.lineEditxcoordinates_judgmental,
-            self.lineEditycoordinate_judgmental,
-            self.checkBoxoutsidesampling
-        ]
-        for control in controls_coordinates:
-            control.setEnabled(state == Qt.Checked)
+        enabled = state == Qt.Checked
+        self._batch_enable(self.controls_coordinates, enabled)
 
     def on_addsamplesbyfile_changed(self, state):
         """
         Handles the state change of the 'Add Samples by File' checkbox.
         Enables or disables related controls based on whether the checkbox is checked.
         """
-        controls_file = [
-            self.pushButtonloadfilejudgmental,
-            self.lineEditaddsamplesbyfile,
-            self.comboBoxcolumnx,
-            self.comboBoxcolumny,
-            self.pushButtonaddcoordinatesfile_judgmental,
-            self.pushButtonfinishcoordinatesfile_judgmental,
-            self.checkBoxoutsidesampling,
-        ]
-        for control in controls_file:
-            control.setEnabled(state == Qt.Checked)
+        enabled = state == Qt.Checked
+        self._batch_enable(self.controls_file, enabled)
 
     def on_shpsamplingarea_changed(self, state):
         """
         Handles the state change of the 'Shapefile Sampling Area' checkbox.
         Toggles buttons in the AreaExclusionModule based on the checkbox state.
         """
-        if hasattr(self, 'area_exclusion') and self.area_exclusion:
+        if self.area_exclusion:
             self.area_exclusion.toggle_buttons(state)
 
     def on_generateshpbycoordinates_changed(self, state):
@@ -1170,171 +1286,43 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         Handles the state change of the 'Generate Shapefile by Coordinates' checkbox.
         Toggles buttons in the AreaExclusionModule based on the checkbox state.
         """
-        if hasattr(self, 'area_exclusion') and self.area_exclusion:
+        if self.area_exclusion:
             self.area_exclusion.toggle_buttons(state)
 
-    def on_addstratifiedsystematic_changed(self, state):
-        """
-        Handles the state change of the 'Add Stratified Samples Systematically' checkbox.
-        Enables or disables related controls and unchecks other sampling method checkboxes.
-        """
-        if state == Qt.Checked:
-            # Uncheck the random stratified samples checkbox to prevent conflict
-            self.checkBoxaddstratifiedsamplesrandomly.setChecked(False)
-            controls = [
-                self.doubleSpinBoxdistancestratifiedxsamples,
-                self.doubleSpinBoxdistancestratifiedysamples,
-                self.spinBoxanglestratifiedsystematically,
-                self.pushButtonstratifiedsystematicstart,
-                self.pushButtonstratifiedsystematicsave,
-                self.checkBoxstratifiedsampling_zigzagsystematic,
-                self.checkBoxoutsidesampling_stratified,
-                self.doubleSpinBoxdistancestratifiedperimeter,
-                self.doubleSpinBoxdistancestratifiedexclusion
-            ]
-            for control in controls:
-                control.setEnabled(True)
-        else:
-            # Disable the related controls if the checkbox is unchecked
-            controls = [
-                self.doubleSpinBoxdistancestratifiedxsamples,
-                self.doubleSpinBoxdistancestratifiedysamples,
-                self.spinBoxanglestratifiedsystematically,
-                self.pushButtonstratifiedsystematicstart,
-                self.pushButtonstratifiedsystematicsave,
-                self.checkBoxstratifiedsampling_zigzagsystematic,
-                self.checkBoxoutsidesampling_stratified,
-                self.doubleSpinBoxdistancestratifiedperimeter,
-                self.doubleSpinBoxdistancestratifiedexclusion
-            ]
-            for control in controls:
-                control.setEnabled(False)
-
-    def on_addstratifiedrandom_changed(self, state):
-        """
-        Handles the state change of the 'Add Stratified Samples Randomly' checkbox.
-        Unchecks the systematic stratified samples checkbox to prevent conflict.
-        """
-        if state == Qt.Checked:
-            self.checkBoxaddstratifiedsamplessystematically.setChecked(False)
-
-    def on_addclusterrandom_changed(self, state):
+    def on_addsamplesrandomly_changed(self, state):
         """
-        Handles the state change of the 'Add Cluster Samples Randomly' checkbox.
+        Handles the state change of the 'Add Samples Randomly' checkbox.
         Enables or disables related controls based on whether the checkbox is checked.
         """
-        if state == Qt.Checked:
-            controls = [
-                self.spinBoxnumberofclustersamples,
-                self.doubleSpinBoxdistanceclustersamples,
-                self.pushButtonclusterrandomstart,
-                self.pushButtonclusterrandomreset,
-                self.pushButtonclusterrandomsave,
-                self.doubleSpinBoxdistanceclusterperimeter,
-                self.doubleSpinBoxdistanceclusterexclusion,
-                self.checkBoxoutsidesamplingcluster,
-                self.checkBoxadjustclustersamplesbysurfacearea
-            ]
-            for control in controls:
-                control.setEnabled(True)
-        else:
-            controls = [
-                self.spinBoxnumberofclustersamples,
-                self.doubleSpinBoxdistanceclustersamples,
-                self.pushButtonclusterrandomstart,
-                self.pushButtonclusterrandomreset,
-                self.pushButtonclusterrandomsave,
-                self.doubleSpinBoxdistanceclusterperimeter,
-                self.doubleSpinBoxdistanceclusterexclusion,
-                self.checkBoxoutsidesamplingcluster,
-                self.checkBoxadjustclustersamplesbysurfacearea
-            ]
-            for control in controls:
-                control.setEnabled(False)
+        enabled = state == Qt.Checked
+        self._batch_enable(self.controls_random, enabled)
 
-    def on_addclustersystematic_changed(self, state):
+    def _dispatch_function_checkbox(self, name, state):
         """
-        Handles the state change of the 'Add Cluster Samples Systematically' checkbox.
-        Enables or disables related controls and unchecks other sampling method checkboxes.
+        Passes a function checkbox state change to the general handler,
+        then to the checkbox's dedicated handler if it has one.
         """
-        if state == Qt.Checked:
-            # Uncheck the random cluster samples checkbox to prevent conflict
-            self.checkBoxaddclustersamplesrandomly.setChecked(False)
-            controls = [
-                self.doubleSpinBoxdistanceclusterxsamples,
-                self.doubleSpinBoxdistanceclusterysamples,
-                self.spinBoxangleclustersystematically,
-                self.pushButtonclustersystematicstart,
-                self.pushButtonclustersystematicsave,
-                self.checkBoxclustersampling_zigzagcluster,
-                self.checkBoxoutsidesamplingcluster,
-                self.doubleSpinBoxdistanceclusterperimeter,
-                self.doubleSpinBoxdistanceclusterexclusion
-            ]
-            for control in controls:
-                control.setEnabled(True)
-        else:
-            # Disable the related controls if the checkbox is unchecked
-            controls = [
-                self.doubleSpinBoxdistanceclusterxsamples,
-                self.doubleSpinBoxdistanceclusterysamples,
-                self.spinBoxangleclustersystematically,
-                self.pushButtonclustersystematicstart,
-                self.pushButtonclustersystematicsave,
-                self.checkBoxclustersampling_zigzagcluster,
-                self.checkBoxoutsidesamplingcluster,
-                self.doubleSpinBoxdistanceclusterperimeter,
-                self.doubleSpinBoxdistanceclusterexclusion
-            ]
-            for control in controls:
-                control.setEnabled(False)
-
-    def on_addsamplesrandomly_changed(self, state):
-        """
-        Handles the state change of the 'Add Samples Randomly' checkbox.
-        Enables or disables related controls based on whether the checkbox is checked.
-        """
-        controls_random = [
-            self.spinBoxnumberofsamples,
-            self.doubleSpinBoxdistancesamples,
-            self.doubleSpinBoxdistanceexclusion,
-            self.doubleSpinBoxdistanceperimeter,
-            self.pushButtonrandomstart,
-            self.pushButtonrandomreset,
-            self.pushButtonrandomsave,
-            self.checkBoxoutsidesamplingrandom
-        ]
-        for control in controls_random:
-            control.setEnabled(state == Qt.Checked)
+        checkbox = getattr(self, name)
+        self.on_function_checkbox_changed(state, checkbox)
+        handler = self.function_checkbox_handlers.get(name)
+        if handler:
+            handler(state)
 
-    def on_function_checkbox_changed(self, state):
+    def on_function_checkbox_changed(self, state, sender=None):
         """
         Handles the state change of any function-related checkbox.
         Ensures that only one sampling method is active at a time by resetting others.
         """
         if state == Qt.Checked:
-            sender = self.sender()
+            if sender is None:
+                sender = self.sender()
             # Prevent specific checkboxes from triggering this behavior
             if sender != self.checkBoxaddstratifiedsamplessystematically:
-                controls = [
-                    self.doubleSpinBoxdistancestratifiedxsamples,
-                    self.doubleSpinBoxdistancestratifiedysamples,
-                    self.spinBoxanglestratifiedsystematically,
-                    self.pushButtonstratifiedsystematicstart,
-                    self.pushButtonstratifiedsystematicsave,
-                    self.checkBoxstratifiedsampling_zigzagsystematic,
-                    self.checkBoxoutsidesampling_stratified,
-                    self.doubleSpinBoxdistancestratifiedperimeter,
-                    self.doubleSpinBoxdistancestratifiedexclusion
-                ]
-                for control in controls:
-                    control.setEnabled(False)
-
-            # Reset all other sampling methods
+                self._batch_enable(self.controls_stratified_systematic, False)
+
+            # Reset all other sampling methods; this also disables the random sampling controls
             self.reset_manager.reset_all()
-            if self.random_sampling and not self.checkBoxaddsamplesrandomly.isChecked():
-                self.random_sampling.disable_controls()
-            # Ensure the sender checkbox remains checked and doesn't interfere with others
+            # reset_all unchecks every function checkbox, so check the sender again without re-emitting
             sender.blockSignals(True)
             sender.setChecked(True)
             sender.blockSignals(False)
@@ -1357,21 +1345,22 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
         Handles the dialog close event.
         Ensures that temporary layers added during sampling are removed from the QGIS project.
         """
-        # Remove temporary sampling layers from the AreaExclusionModule
-        if hasattr(self, "area_exclusion") and self.area_exclusion:
-            if hasattr(self.area_exclusion, "temp_sampling_layer") and self.area_exclusion.temp_sampling_layer:
-                QgsProject.instance().removeMapLayer(self.area_exclusion.temp_sampling_layer.id())
-            if hasattr(self.area_exclusion, "temp_coordinates_layer") and self.area_exclusion.temp_coordinates_layer:
-                QgsProject.instance().removeMapLayer(self.area_exclusion.temp_coordinates_layer.id())
-
-        # Remove temporary layers from the JudgmentalSampling module
-        if hasattr(self, "judgmental_sampling") and self.judgmental_sampling:
-            if hasattr(self.judgmental_sampling, "temp_layer") and self.judgmental_sampling.temp_layer:
-                try:
-                    QgsProject.instance().removeMapLayer(self.judgmental_sampling.temp_layer.id())
-                except:
-                    pass
-                self.judgmental_sampling.temp_layer = None
+        # Collect the temporary layers of the modules and remove them in one batch
+        layer_ids = []
+        for module_attr, layer_attr, clear_reference in self._TEMP_LAYER_CLEANUP_SPECS:
+            module = getattr(self, module_attr, None)
+            layer = getattr(module, layer_attr, None)
+            if layer is None:
+                continue
+            try:
+                layer_ids.append(layer.id())
+            except RuntimeError:
+                # The layer was already deleted by QGIS
+                pass
+            if clear_reference:
+                setattr(module, layer_attr, None)
+        if layer_ids:
+            QgsProject.instance().removeMapLayers(layer_ids)
 
         # Accept the close event to proceed with closing the dialog
         event.accept()
@@ -1380,116 +1369,12 @@ class SamplingDialog(QtWidgets.QDialog, FORM_CLASS):
     def open_license_file(self):
         """
         Opens a custom styled dialog with plugin information and buttons to view license or close.
+        The dialog is built on first use and reused afterwards.
         """
         try:
-            custom_dialog = QtWidgets.QDialog(self)
-            custom_dialog.setWindowTitle("About Sampling Time Plugin")
-            custom_dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #cccaca;
-                    border: 2px solid #080808;
-                    border-radius: 10px;
-                }
-                QLabel {
-                    color: #2c3e50;
-                    padding: 10px;
-                    background-color: white;
-                    border-radius: 5px;
-                }
-                QPushButton {
-                    background-color: #080808;
-                    color: white;
-                    border: none;
-                    padding: 8px 15px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #545454;
-                }
-                QPushButton:pressed {
-                    background-color: #080808;
-                }
-            """)
-
-            # Adjust (if desired) the minimum size of the dialog for better text visibility
-            custom_dialog.setMinimumSize(650, 400)
-
-            layout = QtWidgets.QVBoxLayout(custom_dialog)
-            layout.setContentsMargins(20, 20, 20, 20)
-            layout.setSpacing(15)
-
-            title_label = QtWidgets.QLabel("Sampling Time Plugin")
-            title_label.setStyleSheet("""
-                font-size: 18px;
-                font-weight: bold;
-                color: #080808;
-                background-color: transparent;
-            """)
-            layout.addWidget(title_label)
-
-            # ===== FULL TEXT, WITHOUT ELLIPSIS =====
-            info_text = """<b>A comprehensive QGIS plugin for automated area sampling
-using judgmental, random, systematic, stratified, and cluster techniques.
-This plugin enables the creation of sampling areas, exclusion zones, customizable
-stratification and clustering, and generates shapefiles for outputs.
-Designed for precision and adaptability in geospatial workflows.</b><br><br>
-
-Version: 1.1.0 2025-05-19<br>
-Begin: 2024-09-29<br>
-Author: Marcel A. Cedrez Dacosta<br>
-Contact: marcel.a@giscourse.online<br><br>
-
-<b>How to use the plugin:</b>
-<a href="https://giscourse.online/qgis-sampling-time-plugin/">
-https://giscourse.online/qgis-sampling-time-plugin/
-</a><br><br>
-
-License: This plugin is free software: you can redistribute it and/or modify it under
-the terms of the GNU General Public License as published by the Free Software Foundation,
-either version 3 of the License, or (at your option) any later version.<br><br>
-
-Sampling Time Plugin is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
-without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
-See the GNU General Public License for more details.
-"""
-
-            # Create the label with rich text properties and external links
-            content_label = QtWidgets.QLabel()
-            content_label.setTextFormat(Qt.RichText)
-            content_label.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            content_label.setOpenExternalLinks(True)
-            content_label.setText(info_text)
-            content_label.setWordWrap(True)
-            content_label.setStyleSheet("""
-                font-size: 12px;
-                font-weight: bold;
-                color: #080808;
-                padding: 14px;
-                background-color: white;
-                border-radius: 5px;
-            """)
-
-            # QScrollArea to prevent text from being cut off
-            scroll_area = QtWidgets.QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setWidget(content_label)
-            layout.addWidget(scroll_area)
-
-            button_container = QtWidgets.QHBoxLayout()
-            button_container.setSpacing(10)
-
-            license_button = QtWidgets.QPushButton("LICENSE")
-            close_button = QtWidgets.QPushButton("Close")
-
-            button_container.addWidget(license_button)
-            button_container.addWidget(close_button)
-            layout.addLayout(button_container)
-
-            license_button.clicked.connect(lambda: self._open_license_file(custom_dialog))
-            close_button.clicked.connect(custom_dialog.close)
-
-            custom_dialog.exec_()
+            if self.about_dialog is None:
+                self.about_dialog = self._build_about_dialog()
+            self.about_dialog.exec_()
 
         except Exception as e:
             QMessageBox.warning(
@@ -1498,18 +1383,64 @@ See the GNU General Public License for more details.
                 f"Error opening dialog: {str(e)}"
             )
 
+    def _build_about_dialog(self):
+        """
+        Builds the "About" dialog with its styles, plugin information and buttons.
+        """
+        custom_dialog = QtWidgets.QDialog(self)
+        custom_dialog.setWindowTitle("About Sampling Time Plugin")
+        custom_dialog.setStyleSheet(ABOUT_DIALOG_STYLESHEET)
+
+        # Adjust (if desired) the minimum size of the dialog for better text visibility
+        custom_dialog.setMinimumSize(650, 400)
+
+        layout = QtWidgets.QVBoxLayout(custom_dialog)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        title_label = QtWidgets.QLabel("Sampling Time Plugin")
+        title_label.setStyleSheet(ABOUT_TITLE_STYLESHEET)
+        layout.addWidget(title_label)
+
+        # Create the label with rich text properties and external links
+        content_label = QtWidgets.QLabel()
+        content_label.setTextFormat(Qt.RichText)
+        content_label.setTextInteractionFlags(Qt.TextBrowserInteraction)
+        content_label.setOpenExternalLinks(True)
+        content_label.setText(ABOUT_HTML)
+        content_label.setWordWrap(True)
+        content_label.setStyleSheet(ABOUT_TEXT_STYLESHEET)
+
+        # QScrollArea to prevent text from being cut off
+        scroll_area = QtWidgets.QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(content_label)
+        layout.addWidget(scroll_area)
+
+        button_container = QtWidgets.QHBoxLayout()
+        button_container.setSpacing(10)
+
+        license_button = QtWidgets.QPushButton("LICENSE")
+        close_button = QtWidgets.QPushButton("Close")
+
+        button_container.addWidget(license_button)
+        button_container.addWidget(close_button)
+        layout.addLayout(button_container)
+
+        license_button.clicked.connect(lambda: self._open_license_file(custom_dialog))
+        close_button.clicked.connect(custom_dialog.close)
+
+        return custom_dialog
+
     def _open_license_file(self, parent_dialog):
         """Helper method to open the license file"""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        license_file = os.path.join(current_dir, "LICENSE.txt")
-
-        if os.path.exists(license_file):
-            webbrowser.open(license_file)
+        if license_file_exists():
+            webbrowser.open(LICENSE_URL)
         else:
             QMessageBox.warning(
                 parent_dialog,
                 "Error",
-                f"License file not found at: {license_file}"
+                f"License file not found at: {LICENSE_PATH}"
             )
 
 
@@ -1555,6 +1486,9 @@ class SamplingPlugin:
         if self.dlg is None:
             # Instantiate the SamplingDialog if it doesn't exist
             self.dlg = SamplingDialog(self.iface)
+        elif not self.dlg.isVisible():
+            # Reuse the dialog, refreshing its layer list since the project may have changed
+            self.dlg.layer_module.populate_shapefile_layers()
 
         # If the dialog is minimized, restore and activate it
         if self.dlg.windowState() & Qt.WindowMinimized:
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ SamplingTime
+                                 A QGIS plugin
+ A comprehensive QGIS plugin for automated area sampling using judgmental,
+ random, systematic, stratified, and cluster techniques. It enables the 
+ creation of sampling areas, exclusion zones, customizable stratification 
+ and clustering, and generates shapefiles for outputs. Designed for precision 
+ and adaptability in geospatial workflows.
+ -------------------
+        begin                : 2024-09-29
+        copyright            : (C) 2024 by Marcel A. Cedrez
+        email                : marcel.a@giscourse.online
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This file is part of Sampling Time Plugin for QGIS.                   *
+ *                                                                         *
+ *   Sampling Time Plugin is free software: you can redistribute it and/or *
+ *   modify it under the terms of the GNU General Public License as        *
+ *   published by the Free Software Foundation, either version 3 of the    *
+ *   License, or (at your option) any later version.                       *
+ *                                                                         *
+ *   Sampling Time Plugin is distributed in the hope that it will be       *
+ *   useful, but WITHOUT ANY WARRANTY; without even the implied warranty   *
+ *   of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the       *
+ *   GNU General Public License for more details.                          *
+ *                                                                         *
+ *   You should have received a copy of the GNU General Public License     *
+ *   along with Sampling Time Plugin. If not, see                         *
+ *   <https://www.gnu.org/licenses/>.                                      *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import numpy as np
+
+
+def bounding_boxes(geometries):
+    # Returns the bounding boxes of the geometries as an (N, 4) array of xmin, ymin, xmax, ymax
+    boxes = [
+        (box.xMinimum(), box.yMinimum(), box.xMaximum(), box.yMaximum())
+        for box in (geom.boundingBox() for geom in geometries)
+    ]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def points_in_boxes(xs, ys, boxes):
+    # Returns which points fall within at least one of the (N, 4) bounding boxes
+    inside = np.zeros(xs.shape, dtype=bool)
+    for xmin, ymin, xmax, ymax in boxes.tolist():
+        inside |= (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+    return inside
+
+
+def boxes_near_point(boxes, x, y, pad=0.0):
+    # Returns the indices of the (N, 4) bounding boxes that, grown by pad, hold the point
+    return np.flatnonzero(
+        (boxes[:, 0] - pad <= x) & (x <= boxes[:, 2] + pad)
+        & (boxes[:, 1] - pad <= y) & (y <= boxes[:, 3] + pad)
+    )
+
+
+class SampleGrid:
+    # Hash grid of accepted samples with a cell size equal to the minimum distance, so that
+    # checking a candidate only looks at the samples in the 3x3 block of neighbouring cells
+    def __init__(self, min_distance):
+        self.cell_size = min_distance
+        self.min_distance_sq = min_distance * min_distance
+        self.cells = {}
+
+    def is_far_enough(self, x, y):
+        # Returns True if no accepted sample lies closer than the minimum distance
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for px, py in self.cells.get((i, j), ()):
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy < self.min_distance_sq:
+                        return False
+        return True
+
+    def add(self, x, y):
+        # Registers an accepted sample in its grid cell
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        self.cells.setdefault(key, []).append((x, y))
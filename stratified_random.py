@@ -322,10 +322,8 @@ class StratifiedRandomSampling:
     def on_comboBoxshpsampling_currentIndexChanged(self, index):
         # Updates the sampling_area when a different polygon layer is selected
         try:
-            layer_name = self.ui.comboBoxshpsampling.currentText().split(" [")[0]
-            layers = QgsProject.instance().mapLayersByName(layer_name)
-            if layers:
-                layer = layers[0]
+            layer = self.ui._resolve_sampling_layer()
+            if layer:
                 if isinstance(layer, QgsVectorLayer) and layer.geometryType() == QgsWkbTypes.PolygonGeometry:
                     self.set_sampling_area(layer)
                 else:
@@ -620,8 +618,9 @@ class StratifiedRandomSampling:
         nearest_feature = None
         min_distance = float('inf')
 
+        query_geom = QgsGeometry.fromPointXY(point)
         for feature in self.temp_layer.getFeatures():
-            distance = feature.geometry().distance(QgsGeometry.fromPointXY(point))
+            distance = feature.geometry().distance(query_geom)
             if distance < min_distance:
                 min_distance = distance
                 nearest_feature = feature
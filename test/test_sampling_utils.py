@@ -0,0 +1,113 @@
+# coding=utf-8
+"""Sampling helpers test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'marcel.a@giscourse.online'
+__date__ = '2024-09-29'
+__copyright__ = 'Copyright 2024, Marcel A. Cedrez'
+
+import unittest
+
+import numpy as np
+
+from ..sampling_utils import SampleGrid, bounding_boxes, boxes_near_point, points_in_boxes
+
+
+class FakeRectangle:
+    """Stands in for QgsRectangle."""
+
+    def __init__(self, xmin, ymin, xmax, ymax):
+        self.bounds = (xmin, ymin, xmax, ymax)
+
+    def xMinimum(self):
+        return self.bounds[0]
+
+    def yMinimum(self):
+        return self.bounds[1]
+
+    def xMaximum(self):
+        return self.bounds[2]
+
+    def yMaximum(self):
+        return self.bounds[3]
+
+
+class FakeGeometry:
+    """Stands in for QgsGeometry."""
+
+    def __init__(self, *bounds):
+        self.box = FakeRectangle(*bounds)
+
+    def boundingBox(self):
+        return self.box
+
+
+class SamplingUtilsTest(unittest.TestCase):
+    """Test the NumPy helpers used by random sampling."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.boxes = np.array([
+            [0.0, 0.0, 10.0, 10.0],
+            [20.0, 20.0, 30.0, 25.0],
+        ])
+
+    def test_bounding_boxes(self):
+        """Test the boxes are returned as an (N, 4) array."""
+        boxes = bounding_boxes([FakeGeometry(0, 0, 10, 10), FakeGeometry(20, 20, 30, 25)])
+        np.testing.assert_array_equal(boxes, self.boxes)
+
+    def test_bounding_boxes_empty(self):
+        """Test no geometries give an empty (0, 4) array."""
+        self.assertEqual(bounding_boxes([]).shape, (0, 4))
+
+    def test_points_in_boxes(self):
+        """Test points inside, on the edge of and outside the boxes."""
+        xs = np.array([5.0, 10.0, 15.0, 25.0, 25.0])
+        ys = np.array([5.0, 0.0, 15.0, 22.0, 26.0])
+        np.testing.assert_array_equal(
+            points_in_boxes(xs, ys, self.boxes),
+            [True, True, False, True, False]
+        )
+
+    def test_points_in_no_boxes(self):
+        """Test no point is inside when there are no boxes."""
+        xs = np.array([1.0, 2.0])
+        inside = points_in_boxes(xs, xs, np.empty((0, 4)))
+        self.assertFalse(inside.any())
+
+    def test_boxes_near_point(self):
+        """Test the boxes holding a point, with and without padding."""
+        self.assertEqual(boxes_near_point(self.boxes, 5.0, 5.0).tolist(), [0])
+        self.assertEqual(boxes_near_point(self.boxes, 15.0, 15.0).tolist(), [])
+        self.assertEqual(boxes_near_point(self.boxes, 15.0, 15.0, 5.0).tolist(), [0, 1])
+        self.assertEqual(boxes_near_point(np.empty((0, 4)), 0.0, 0.0).tolist(), [])
+
+    def test_sample_grid(self):
+        """Test the grid rejects samples closer than the minimum distance."""
+        grid = SampleGrid(1.0)
+        self.assertTrue(grid.is_far_enough(0.5, 0.5))
+        grid.add(0.5, 0.5)
+        self.assertFalse(grid.is_far_enough(1.2, 0.5))
+        self.assertFalse(grid.is_far_enough(-0.3, 0.5))
+        self.assertTrue(grid.is_far_enough(1.5, 0.5))
+        self.assertTrue(grid.is_far_enough(1.3, 1.3))
+
+    def test_sample_grid_across_cells(self):
+        """Test close samples in neighbouring cells are found."""
+        grid = SampleGrid(2.0)
+        grid.add(1.9, 1.9)
+        self.assertFalse(grid.is_far_enough(2.1, 2.1))
+        self.assertTrue(grid.is_far_enough(5.0, 5.0))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(SamplingUtilsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)